@@ -190,12 +190,26 @@
 # %% [markdown]
 # ### Basic Workflow Example
 #
-# Let's create a workflow that runs our temperature conversion tests:
+# Let's create a workflow that runs our temperature conversion tests.
+#
+# Throughout this lecture, every example configuration is stored in one dictionary and printed
+# with the same small helper, so each example cell only has to hold the YAML itself:
+
+# %%
+WORKFLOWS = {}
+
+
+def show_workflow(name, title):
+    """Print the example CI configuration stored under ``name`` below a title banner."""
+    print(title)
+    print("=" * 70)
+    print(WORKFLOWS[name])
+
 
 # %%
 # This represents: .github/workflows/tests.yml
 
-basic_workflow = """
+WORKFLOWS["basic"] = """
 name: Test Suite
 
 # When to run this workflow
@@ -205,11 +219,17 @@ on:
   pull_request:
     branches: [ main ]
 
+# Cancel outdated runs of the same pull request
+concurrency:
+  group: ${{ github.workflow }}-${{ github.event.pull_request.number || github.ref }}
+  cancel-in-progress: ${{ github.event_name == 'pull_request' }}
+
 # What to do
 jobs:
   test:
     name: Run Tests
     runs-on: ubuntu-latest
+    timeout-minutes: 15  # Fail fast instead of GitHub's 6-hour default
     
     steps:
       # Step 1: Get the code
@@ -220,24 +240,25 @@ jobs:
       - name: Set up Python 3.11
         uses: actions/setup-python@v5
         with:
-          python-version: "3.11"
+          python-version: "3.11.9"
+          check-latest: false
+          cache: 'pip'  # Reuse downloaded packages from earlier runs
+          cache-dependency-path: 'requirements.txt'
       
       # Step 3: Install dependencies
       - name: Install dependencies
         run: |
           python -m pip install --upgrade pip
-          pip install pytest pytest-cov
+          pip install pytest pytest-cov pytest-timeout pytest-xdist
           pip install -r requirements.txt
       
       # Step 4: Run tests
       - name: Run tests with coverage
         run: |
-          pytest --cov=src --cov-report=term-missing tests/
+          pytest -n auto --dist loadfile --timeout=60 --cov=src --cov-report=term-missing tests/
 """
 
-print("GitHub Actions Workflow:")
-print("=" * 70)
-print(basic_workflow)
+show_workflow("basic", "GitHub Actions Workflow:")
 
 # %% [markdown]
 # ### Understanding the Workflow
@@ -251,12 +272,39 @@ print(basic_workflow)
 # **Jobs (`jobs`):**
 # - `runs-on: ubuntu-latest`: Use Ubuntu Linux virtual machine—most common, fastest
 # - Could also use `windows-latest` or `macos-latest`—useful for cross-platform testing
+# - `timeout-minutes: 15`: Without it, a hanging test (e.g., an accidental infinite loop) keeps the
+#   runner busy for GitHub's default of 6 hours—multiplied by every matrix configuration
+# - `pytest --timeout=60` (from the `pytest-timeout` plugin) fails the individual stuck test after
+#   60 seconds, so you see *which* test hangs long before the job-level timeout fires
+# - `pytest -n auto` (from the `pytest-xdist` plugin) runs the tests on all CPU cores of the runner
+#   (see Part 8); `--dist loadfile` keeps the tests of one file on the same worker, and `pytest-cov`
+#   merges the coverage data of all workers automatically
+#
+# **Concurrency (`concurrency`):**
+# - Groups all runs of this workflow for the same pull request (or branch)
+# - On pull requests, a new push cancels the run still in progress—its result would be outdated anyway
 #
 # **Steps:**
 # - `uses`: Pre-built action from GitHub marketplace—tested, maintained code you can trust
 # - `run`: Shell command to execute—anything you'd type in terminal
 # - Each step runs in sequence—if one fails, the job fails
 #
+# **Pinning the Python version:**
+# - `python-version: "3.11.9"` names an exact patch release instead of just `"3.11"`
+# - GitHub quietly moves `"3.11"` to the newest patch when runner images are refreshed; dependency
+#   caches (see Part 8) are keyed on the exact interpreter version, so every silent bump throws them away
+# - `check-latest: false` (the default, written out to make the intent explicit) tells the action to use
+#   the pinned interpreter from the runner's tool cache instead of looking for a newer one
+# - The price is a manual bump every few months—a good trade for stable, frequently reused caches
+#
+# **Caching downloads (`cache: 'pip'`):**
+# - Without it, every run downloads `pytest` and all dependencies from PyPI again
+# - `actions/setup-python` saves pip's download cache at the end of a run and restores it at the start
+#   of the next one; the cache key includes the hash of `cache-dependency-path`, so the cache is renewed
+#   exactly when `requirements.txt` changes
+# - Most workflows in this lecture use this option; the next example shows what it does by hand with
+#   `actions/cache`—use one or the other, never both for the same directory
+#
 # **Why this prevents disasters:**
 # - Tests run automatically on every push—no way to forget
 # - Can't merge PR with failing tests—GitHub shows red X, reviewers see it
@@ -287,23 +335,39 @@ print(basic_workflow)
 # ### Testing on Multiple Python Versions
 
 # %%
-multi_python_workflow = """
+WORKFLOWS["multi_python"] = """
 name: Test Suite
 
 on: [push, pull_request]
 
+concurrency:
+  group: ${{ github.workflow }}-${{ github.event.pull_request.number || github.ref }}
+  cancel-in-progress: ${{ github.event_name == 'pull_request' }}
+
 jobs:
   test:
     name: Test Python ${{ matrix.python-version }}
     runs-on: ubuntu-latest
+    timeout-minutes: 15
     
     strategy:
+      max-parallel: 3  # Leave runners free for other workflows
       matrix:
         python-version: ["3.8", "3.9", "3.10", "3.11", "3.12"]
     
     steps:
       - uses: actions/checkout@v4
       
+      # Reuse downloaded wheels across runs and across matrix legs
+      - name: Cache pip downloads
+        uses: actions/cache@v4
+        with:
+          path: ~/.cache/pip
+          key: pip-${{ runner.os }}-${{ matrix.python-version }}-${{ hashFiles('requirements.txt') }}
+          restore-keys: |
+            pip-${{ runner.os }}-${{ matrix.python-version }}-
+            pip-${{ runner.os }}-
+      
       - name: Set up Python ${{ matrix.python-version }}
         uses: actions/setup-python@v5
         with:
@@ -312,37 +376,61 @@ jobs:
       - name: Install dependencies
         run: |
           python -m pip install --upgrade pip
-          pip install pytest pytest-cov
+          pip install pytest pytest-cov pytest-xdist
           if [ -f requirements.txt ]; then pip install -r requirements.txt; fi
       
       - name: Run tests
-        run: pytest --cov=src tests/
+        run: pytest -n auto --dist loadfile --cov=src tests/
 """
 
-print("Multi-Python Version Testing:")
-print("=" * 70)
-print(multi_python_workflow)
+show_workflow("multi_python", "Multi-Python Version Testing:")
 print("\n✓ This runs tests on 5 different Python versions!")
 print("✓ Ensures compatibility across Python versions")
+print("✓ Caches pip downloads so wheels are not fetched from PyPI on every run")
+
+# %% [markdown]
+# **Caching with a fallback ladder:** Five matrix jobs would otherwise download the same wheels from
+# PyPI five times on every push. The `actions/cache` step stores pip's download cache (`~/.cache/pip`
+# on Linux) under a `key` built from the OS, the Python version and a hash of `requirements.txt`:
+#
+# - **Exact hit**: nothing changed—pip installs straight from the local cache
+# - **Partial hit via `restore-keys`**: if `requirements.txt` changed, the newest cache for the same
+#   OS and Python version is restored instead; if there is none (e.g., a newly added Python 3.13 job),
+#   any cache for the same OS is used. Only the wheels that are actually new get downloaded.
+# - **Miss**: the job runs as before and saves a fresh cache at the end
+#
+# Because the key contains a hash of `requirements.txt`, the cache is replaced automatically when
+# your dependencies change—stale wheels never pile up.
+#
+# **Limiting parallel jobs:** A matrix starts all its jobs at once. If your organization shares a small
+# pool of runners (common for self-hosted runners at research institutions), one push can occupy all
+# of them, and everybody else's jobs wait in the queue. `max-parallel: 3` runs at most three versions
+# at a time. This makes your own run a bit slower, but keeps the pool fair for everyone else—pick the
+# limit based on the size of the pool.
 
 # %% [markdown]
 # ### Testing on Multiple Operating Systems
 
 # %%
-multi_os_workflow = """
+WORKFLOWS["multi_os"] = """
 name: Cross-Platform Tests
 
 on: [push, pull_request]
 
+concurrency:
+  group: ${{ github.workflow }}-${{ github.event.pull_request.number || github.ref }}
+  cancel-in-progress: ${{ github.event_name == 'pull_request' }}
+
 jobs:
   test:
     name: Test on ${{ matrix.os }}
     runs-on: ${{ matrix.os }}
+    timeout-minutes: 15
     
     strategy:
       matrix:
         os: [ubuntu-latest, windows-latest, macos-latest]
-        python-version: ["3.11"]
+        python-version: ["3.11.9"]  # Exact patch release, same on every OS
     
     steps:
       - uses: actions/checkout@v4
@@ -351,20 +439,21 @@ jobs:
         uses: actions/setup-python@v5
         with:
           python-version: ${{ matrix.python-version }}
+          check-latest: false
+          cache: 'pip'
+          cache-dependency-path: 'requirements.txt'
       
       - name: Install dependencies
         run: |
           python -m pip install --upgrade pip
-          pip install pytest pytest-cov
+          pip install pytest pytest-cov pytest-xdist
           pip install -r requirements.txt
       
       - name: Run tests
-        run: pytest --cov=src tests/
+        run: pytest -n auto --dist loadfile --cov=src tests/
 """
 
-print("Cross-Platform Testing:")
-print("=" * 70)
-print(multi_os_workflow)
+show_workflow("multi_os", "Cross-Platform Testing:")
 print("\n✓ Tests on Linux, Windows, and macOS")
 print("✓ Catches platform-specific bugs")
 
@@ -372,15 +461,20 @@ print("✓ Catches platform-specific bugs")
 # ### Code Quality Checks
 
 # %%
-quality_workflow = """
+WORKFLOWS["quality"] = """
 name: Code Quality
 
 on: [push, pull_request]
 
+concurrency:
+  group: ${{ github.workflow }}-${{ github.event.pull_request.number || github.ref }}
+  cancel-in-progress: ${{ github.event_name == 'pull_request' }}
+
 jobs:
   lint:
     name: Lint with flake8
     runs-on: ubuntu-latest
+    timeout-minutes: 15
     
     steps:
       - uses: actions/checkout@v4
@@ -388,7 +482,10 @@ jobs:
       - name: Set up Python
         uses: actions/setup-python@v5
         with:
-          python-version: "3.11"
+          python-version: "3.11.9"
+          check-latest: false
+          cache: 'pip'
+          cache-dependency-path: 'requirements.txt'
       
       - name: Install linting tools
         run: |
@@ -408,6 +505,7 @@ jobs:
   test:
     name: Run tests
     runs-on: ubuntu-latest
+    timeout-minutes: 15
     
     steps:
       - uses: actions/checkout@v4
@@ -415,26 +513,27 @@ jobs:
       - name: Set up Python
         uses: actions/setup-python@v5
         with:
-          python-version: "3.11"
+          python-version: "3.11.9"
+          check-latest: false
+          cache: 'pip'
+          cache-dependency-path: 'requirements.txt'
       
       - name: Install dependencies
         run: |
           python -m pip install --upgrade pip
-          pip install pytest pytest-cov
+          pip install pytest pytest-cov pytest-xdist
           pip install -r requirements.txt
       
       - name: Run tests with coverage
         run: |
-          pytest --cov=src --cov-report=xml --cov-report=term tests/
+          pytest -n auto --dist loadfile --cov=src --cov-report=xml --cov-report=term tests/
       
       - name: Check coverage threshold
         run: |
           coverage report --fail-under=80
 """
 
-print("Code Quality Workflow:")
-print("=" * 70)
-print(quality_workflow)
+show_workflow("quality", "Code Quality Workflow:")
 print("\n✓ Checks code formatting with black")
 print("✓ Lints code with flake8")
 print("✓ Ensures 80% test coverage")
@@ -446,7 +545,7 @@ print("✓ Fails build if quality standards not met")
 # ### Full Production-Ready Workflow
 
 # %%
-complete_workflow = """
+WORKFLOWS["complete"] = """
 name: Temperature Module CI
 
 on:
@@ -455,107 +554,347 @@ on:
   pull_request:
     branches: [ main ]
 
+concurrency:
+  group: ${{ github.workflow }}-${{ github.event.pull_request.number || github.ref }}
+  cancel-in-progress: ${{ github.event_name == 'pull_request' }}
+
 jobs:
-  # Job 1: Code Quality Checks
+  # Job 0: Did anything besides documentation change? Always runs and takes seconds
+  changes:
+    name: Detect Changes
+    runs-on: ubuntu-latest
+    timeout-minutes: 5
+    outputs:
+      code: ${{ steps.filter.outputs.code }}
+    
+    steps:
+      - name: Check out code
+        uses: actions/checkout@v4
+      
+      - name: Filter changed files
+        id: filter
+        uses: dorny/paths-filter@v3
+        with:
+          predicate-quantifier: every  # A file counts only if it matches none of the exclusions
+          filters: |
+            code:
+              - '**'
+              - '!**.md'
+              - '!docs/**'
+              - '!.gitignore'
+              - '!LICENSE'
+  
+  # Job 1: Code Quality Checks (not filtered: with cached hooks it takes only seconds)
   quality:
     name: Code Quality
     runs-on: ubuntu-latest
+    timeout-minutes: 5
     
     steps:
       - name: Check out code
         uses: actions/checkout@v4
       
+      # Shared setup from .github/actions/setup-python-env (see below)
       - name: Set up Python
-        uses: actions/setup-python@v5
+        uses: ./.github/actions/setup-python-env
         with:
-          python-version: "3.11"
-      
-      - name: Install tools
-        run: |
-          python -m pip install --upgrade pip
-          pip install flake8 black isort
-      
-      - name: Check import sorting
-        run: isort --check-only src/ tests/
-      
-      - name: Check code formatting
-        run: black --check src/ tests/
+          install-dev-dependencies: "false"  # pre-commit brings its own tools
       
-      - name: Lint code
-        run: flake8 src/ tests/ --max-line-length=100
+      # Runs isort, black and flake8 as configured in .pre-commit-config.yaml;
+      # the action caches the hook environments in ~/.cache/pre-commit
+      - name: Run pre-commit hooks
+        uses: pre-commit/action@v3.0.1
   
-  # Job 2: Run Tests
+  # Job 2: Run Tests on all Python versions, one runner per operating system
   test:
-    name: Test Suite
+    name: Test Suite (${{ matrix.os }})
     runs-on: ${{ matrix.os }}
+    timeout-minutes: 15
+    needs: changes
+    if: needs.changes.outputs.code == 'true'  # Skipped for documentation-only changes
     
     strategy:
       fail-fast: false
       matrix:
         os: [ubuntu-latest, windows-latest, macos-latest]
-        python-version: ["3.9", "3.10", "3.11", "3.12"]
     
     steps:
       - name: Check out code
         uses: actions/checkout@v4
       
-      - name: Set up Python ${{ matrix.python-version }}
+      # Installs all four interpreters side by side in one job
+      - name: Set up Python 3.9 - 3.12
         uses: actions/setup-python@v5
         with:
-          python-version: ${{ matrix.python-version }}
+          python-version: |
+            3.9
+            3.10
+            3.11
+            3.12
       
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install pytest pytest-cov
-          pip install -r requirements.txt
+      - name: Set up uv
+        uses: astral-sh/setup-uv@v3
+        with:
+          enable-cache: true
       
+      - name: Install tox
+        run: uv pip install --system tox tox-uv
+      
+      # One tox environment per Python version (see tox.ini), run in parallel;
+      # no coverage here: measuring it slows every test run down
       - name: Run unit tests
+        run: tox run-parallel
+  
+  # Job 3: Fast feedback on Linux: tests with coverage once, then build the package
+  # (the package check does not wait for the slower Windows and macOS runners)
+  coverage:
+    name: Coverage
+    runs-on: ubuntu-latest
+    timeout-minutes: 15
+    needs: changes
+    if: needs.changes.outputs.code == 'true'
+    
+    steps:
+      - name: Check out code
+        uses: actions/checkout@v4
+      
+      - name: Set up Python and install dependencies
+        uses: ./.github/actions/setup-python-env
+      
+      - name: Run tests with coverage
         run: |
-          pytest tests/ -v --cov=src --cov-report=xml --cov-report=term-missing
+          pytest tests/ -n auto --dist loadfile --timeout=60 --cov=src --cov-report=xml --cov-report=term-missing --cov-fail-under=80
       
       - name: Upload coverage to Codecov
-        if: matrix.os == 'ubuntu-latest' && matrix.python-version == '3.11'
-        uses: codecov/codecov-action@v3
+        uses: codecov/codecov-action@v5
         with:
-          file: ./coverage.xml
+          files: ./coverage.xml
+          token: ${{ secrets.CODECOV_TOKEN }}
           fail_ci_if_error: true
+      
+      # Build the package once, in the job that already has everything set up
+      - name: Build package
+        run: |
+          uv pip install --system build
+          python -m build
+      
+      - name: Upload package for the build job
+        uses: actions/upload-artifact@v4
+        with:
+          name: dist
+          path: dist/
   
-  # Job 3: Build and validate package
+  # Job 4: Validate the package built by the coverage job
   build:
-    name: Build Package
+    name: Check Package
     runs-on: ubuntu-latest
-    needs: [quality, test]
+    timeout-minutes: 15
+    needs: [quality, coverage]
     
     steps:
-      - name: Check out code
-        uses: actions/checkout@v4
+      - name: Download package
+        uses: actions/download-artifact@v4
+        with:
+          name: dist
+          path: dist/
       
       - name: Set up Python
         uses: actions/setup-python@v5
         with:
-          python-version: "3.11"
-      
-      - name: Install build tools
-        run: |
-          python -m pip install --upgrade pip
-          pip install build twine
-      
-      - name: Build package
-        run: python -m build
+          python-version: "3.11.9"
+          check-latest: false
       
       - name: Check package
-        run: twine check dist/*
+        run: |
+          pip install twine
+          twine check dist/*
+  
+  # Job 5: A single status to require in the branch protection rules
+  all-checks:
+    name: All Checks
+    runs-on: ubuntu-latest
+    timeout-minutes: 5
+    needs: [changes, quality, test, coverage, build]
+    if: ${{ !cancelled() }}  # Also run (and fail) when a job above failed, but not when the run was cancelled
+    
+    steps:
+      - name: Check results of all jobs
+        if: contains(needs.*.result, 'failure') || contains(needs.*.result, 'cancelled')
+        run: exit 1
 """
 
-print("Complete Production CI Workflow:")
-print("=" * 70)
-print(complete_workflow)
+show_workflow("complete", "Complete Production CI Workflow:")
 print("\n✅ Multiple jobs running in parallel")
-print("✅ Tests on 4 Python versions × 3 operating systems = 12 configurations")
+print("✅ Tests on 4 Python versions × 3 operating systems = 12 configurations, on 3 runners")
 print("✅ Code quality enforced")
-print("✅ Coverage tracking with Codecov")
+print("✅ Coverage measured once and tracked with Codecov")
 print("✅ Package build validation")
+print("✅ One all-checks job to require for merging")
+print("✅ Test jobs skipped for documentation-only changes")
+
+# %% [markdown]
+# ### Faster Dependency Installs with `uv`
+#
+# The `test` and `coverage` jobs above install their dependencies with [`uv`](https://docs.astral.sh/uv/)
+# instead of plain `pip`. With 12 configurations, dependencies are installed 12 times per push, so the
+# speed of the installer matters:
+#
+# - `uv pip install` is a drop-in replacement for `pip install`—same requirement syntax, same packages
+#   from PyPI—written in Rust, with a much faster dependency resolver and parallel downloads
+# - `--system` installs into the Python provided by `actions/setup-python` (no virtual environment
+#   needed on a throwaway CI runner)
+# - `enable-cache: true` lets `astral-sh/setup-uv` save and restore uv's download cache between runs
+# - The `tox-uv` plugin makes `tox` (next section) create its environments with `uv` as well
+#
+# Typical result: an install step that took 20–60 seconds with `pip` finishes in a few seconds.
+# The simpler workflows earlier in this lecture keep plain `pip`, which you will find in almost every
+# project—knowing both is useful.
+#
+# ### All Python Versions in One Job: `tox`
+#
+# Every job pays for starting a runner, checking out the code and setting up Python before a single test
+# runs. A matrix entry per Python version pays this four times per operating system. Instead,
+# `actions/setup-python` accepts a list of versions and installs all of them in one job within seconds,
+# and [`tox`](https://tox.wiki/) runs the tests once per version, each in its own virtual environment.
+# The environments are defined in a `tox.ini` next to the code:
+#
+# ```ini
+# [tox]
+# envlist = py39, py310, py311, py312
+#
+# [testenv]
+# deps =
+#     pytest
+#     pytest-timeout
+#     -r requirements.txt
+# commands = pytest tests/ --timeout=60
+# ```
+#
+# `tox run-parallel` runs the four environments at the same time, using the runner's CPU cores. The
+# matrix now only varies the operating system: 3 runners instead of 12, with the same 12 combinations
+# tested. The same `tox` command works on your laptop, if the Python versions are installed there.
+#
+# **When every combination needs its own runner:** If the versions cannot share a job (for example,
+# because each one needs a different compiled library), you do not have to test the full product either.
+# A hand-picked `include:` list, in which every operating system and every Python version still appears
+# at least once, catches nearly all platform- and version-specific bugs with half the runners:
+#
+# ```yaml
+# strategy:
+#   fail-fast: false
+#   matrix:
+#     include:
+#       - {os: ubuntu-latest,  python-version: "3.9"}
+#       - {os: ubuntu-latest,  python-version: "3.11"}
+#       - {os: ubuntu-latest,  python-version: "3.12"}
+#       - {os: windows-latest, python-version: "3.10"}
+#       - {os: windows-latest, python-version: "3.12"}
+#       - {os: macos-latest,   python-version: "3.11"}
+# ```
+#
+# The full product can still run once per night on a `schedule:` trigger.
+#
+# ### Sharing Setup Steps: Composite Actions
+#
+# The `quality` and `coverage` jobs both need the same pinned Python, and `coverage` also needs `uv` and
+# the test dependencies. Instead of copying these steps into every job, they live in a *composite
+# action* inside the repository, which any job can call with `uses: ./.github/actions/setup-python-env`
+# after the checkout:
+#
+# ```yaml
+# # .github/actions/setup-python-env/action.yml
+# name: Set up Python environment
+# description: Pinned Python, uv, and the development dependencies
+# inputs:
+#   install-dev-dependencies:
+#     description: Install requirements-dev.txt
+#     default: "true"
+# runs:
+#   using: composite
+#   steps:
+#     - uses: actions/setup-python@v5
+#       with:
+#         python-version: "3.11.9"
+#         check-latest: false
+#     - uses: astral-sh/setup-uv@v3
+#       with:
+#         enable-cache: true
+#     - if: inputs.install-dev-dependencies == 'true'
+#       shell: bash
+#       run: uv pip install --system -r requirements-dev.txt
+# ```
+#
+# `requirements-dev.txt` lists `pytest`, `pytest-cov`, `pytest-timeout` and `pytest-xdist` and includes the runtime
+# dependencies with `-r requirements.txt`. A Python version bump is now a one-line change, and since
+# all jobs install the same file, they share the same `uv` cache entry.
+#
+# ### One Lint Configuration for Laptop and CI: `pre-commit`
+#
+# The `quality` job no longer installs `isort`, `black` and `flake8` one by one. Instead it runs
+# [pre-commit](https://pre-commit.com/), which reads the tool list from a `.pre-commit-config.yaml`
+# file in the repository:
+#
+# ```yaml
+# # .pre-commit-config.yaml
+# repos:
+#   - repo: https://github.com/PyCQA/isort
+#     rev: 5.13.2
+#     hooks:
+#       - id: isort
+#   - repo: https://github.com/psf/black
+#     rev: 24.8.0
+#     hooks:
+#       - id: black
+#   - repo: https://github.com/PyCQA/flake8
+#     rev: 7.1.1
+#     hooks:
+#       - id: flake8
+#         args: [--max-line-length=100]
+# ```
+#
+# **Why this is better:**
+# - **Faster CI**: `pre-commit/action` caches all hook environments under a key derived from
+#   `.pre-commit-config.yaml`, so on a cache hit nothing is installed at all (~1 s instead of ~15 s)
+# - **Same checks everywhere**: run `pre-commit install` once and the identical hooks run on every
+#   `git commit` on your laptop—CI simply confirms what you already checked locally
+# - **Pinned tool versions**: the `rev:` fields fix the linter versions, so a new `black` release
+#   cannot suddenly fail your CI
+#
+# ### Build Once, Reuse Everywhere: Artifacts
+#
+# The package is built inside the `coverage` job (which has Python and `uv` ready anyway) and handed
+# to the `build` job with `actions/upload-artifact` and `actions/download-artifact`. The `build` job therefore skips the checkout and the build step and only
+# runs `twine check` on exactly the files that were tested—no duplicated work, and no chance of
+# validating a different build than the one you tested.
+#
+# **Do not wait for the slowest runner:** Windows and macOS runners start and run more slowly than Linux
+# ones. `build` therefore only needs `quality` and the Linux `coverage` job, which ran the whole test
+# suite already; it checks the package while the `test` matrix may still be running. The final
+# `all-checks` job waits for everything and fails if any job failed. Requiring just this one check in
+# the branch protection rules is simpler than listing every matrix job—and stays correct when the
+# matrix changes.
+#
+# **Skip tests, not the workflow:** Fixing a typo in the README does not need 12 test runs. The
+# `changes` job uses `dorny/paths-filter` to check whether anything besides Markdown, `docs/`,
+# `.gitignore` or `LICENSE` changed; if not, `test` and `coverage` are skipped (and `build` with them).
+# `quality` is cheap enough with its cached hooks that filtering it is not worth it. What matters is
+# that `all-checks` does not depend on the filter: it runs unless the workflow was cancelled, so a
+# documentation-only pull request still gets the required status—skipped jobs count as passed.
+#
+# **Keep actions up to date:** The version after `@` is not just a formality. `actions/upload-artifact@v4`
+# uploads and downloads much faster than `@v3` (which GitHub has since switched off), and
+# `codecov/codecov-action@v5` uses Codecov's newer, faster upload client (it also expects `files:` instead
+# of `file:` and a `CODECOV_TOKEN` secret). Outdated action versions make workflows slower, and
+# eventually they stop working. Dependabot can open pull requests for action updates automatically.
+#
+# ### Coverage in One Job, Not in Every Matrix Cell
+#
+# `pytest --cov` records every executed line, which makes the test run noticeably slower (often by
+# 20–40%). Whether the code works on Windows with Python 3.9 is a question for the matrix; how much of
+# the code the tests cover is the same answer in every configuration. The matrix therefore runs plain
+# `pytest`, and the separate `coverage` job measures coverage once, enforces the 80% minimum with
+# `--cov-fail-under=80` and uploads the report. Since it does not depend on the matrix, it runs at
+# the same time and does not make the workflow take longer.
 
 # %% [markdown]
 # ## Part 6: GitHub Actions for Research Projects
@@ -563,42 +902,64 @@ print("✅ Package build validation")
 # ### Research-Specific Workflow
 
 # %%
-research_workflow = """
+WORKFLOWS["research"] = """
 name: Research Pipeline
 
 on:
   push:
     branches: [ main ]
+    # Only run when something the analysis depends on changed (not for README edits)
+    paths: &analysis-paths
+      - 'src/**'
+      - 'scripts/**'
+      - 'notebooks/**'
+      - 'tests/**'
+      - 'data/**'
+      - 'requirements.txt'
+      - 'requirements.lock'
+      - '.github/workflows/research.yml'
   pull_request:
     branches: [ main ]
+    paths: *analysis-paths
   schedule:
     # Run nightly at 2 AM UTC
     - cron: '0 2 * * *'
 
+concurrency:
+  group: ${{ github.workflow }}-${{ github.event.pull_request.number || github.ref }}
+  cancel-in-progress: ${{ github.event_name == 'pull_request' }}
+
+# Only install pre-built wheels: fail fast instead of silently compiling a package from source
+env:
+  PIP_ONLY_BINARY: ":all:"
+
 jobs:
   test-analysis:
     name: Test Analysis Code
     runs-on: ubuntu-latest
+    timeout-minutes: 15
+    defaults:
+      run:
+        shell: bash -el {0}  # Login shell, so the micromamba environment is active
     
     steps:
       - uses: actions/checkout@v4
       
-      - name: Set up Python
-        uses: actions/setup-python@v5
+      # Python and the pre-built scientific stack from conda-forge, cached as a whole environment
+      - name: Set up scientific stack
+        uses: mamba-org/setup-micromamba@v2
         with:
-          python-version: "3.11"
-      
-      - name: Install scientific stack
-        run: |
-          python -m pip install --upgrade pip
-          pip install pytest numpy pandas matplotlib scipy
+          environment-file: environment-ci.yml
+          cache-environment: true
+          cache-downloads: true
       
       - name: Run analysis tests
-        run: pytest tests/test_analysis.py -v
+        run: pytest tests/test_analysis.py -v -n auto --dist loadfile --timeout=60
   
   test-notebooks:
     name: Test Jupyter Notebooks
     runs-on: ubuntu-latest
+    timeout-minutes: 15
     
     steps:
       - uses: actions/checkout@v4
@@ -606,21 +967,25 @@ jobs:
       - name: Set up Python
         uses: actions/setup-python@v5
         with:
-          python-version: "3.11"
+          python-version: "3.11.9"
+          check-latest: false
+          cache: 'pip'
+          cache-dependency-path: 'requirements.txt'
       
       - name: Install dependencies
         run: |
           python -m pip install --upgrade pip
-          pip install jupyter nbconvert nbformat numpy pandas matplotlib
+          pip install pytest nbmake pytest-xdist numpy pandas matplotlib
       
+      # Every notebook becomes one pytest test; -n auto runs them in parallel
       - name: Execute notebooks
         run: |
-          jupyter nbconvert --to notebook --execute \
-            notebooks/*.ipynb --output-dir=/tmp/executed_notebooks/
+          pytest --nbmake -n auto --nbmake-timeout=300 notebooks/
   
   validate-data:
     name: Validate Data Quality
     runs-on: ubuntu-latest
+    timeout-minutes: 15
     
     steps:
       - uses: actions/checkout@v4
@@ -628,7 +993,10 @@ jobs:
       - name: Set up Python
         uses: actions/setup-python@v5
         with:
-          python-version: "3.11"
+          python-version: "3.11.9"
+          check-latest: false
+          cache: 'pip'
+          cache-dependency-path: 'requirements.txt'
       
       - name: Install dependencies
         run: |
@@ -637,9 +1005,12 @@ jobs:
       - name: Run data validation
         run: python scripts/validate_data.py
   
-  reproducibility-check:
-    name: Reproducibility Check
+  # Reproducibility check, split into stages that pass results on as artifacts:
+  # prepare-data -> fit-model -> (make-plots and compare-results in parallel)
+  prepare-data:
+    name: Prepare Data
     runs-on: ubuntu-latest
+    timeout-minutes: 15
     needs: [test-analysis, test-notebooks]
     
     steps:
@@ -648,34 +1019,234 @@ jobs:
       - name: Set up Python
         uses: actions/setup-python@v5
         with:
-          python-version: "3.11"
+          python-version: "3.11.9"
+          check-latest: false
+          cache: 'pip'
+          cache-dependency-path: 'requirements.lock'
       
       - name: Install dependencies
         run: |
-          pip install -r requirements.txt
+          pip install --require-hashes --no-deps -r requirements.lock
       
-      - name: Run full analysis pipeline
-        run: bash scripts/run_analysis.sh
+      - name: Prepare input data
+        run: python scripts/prepare_data.py --output data/processed/
+      
+      - uses: actions/upload-artifact@v4
+        with:
+          name: processed-data
+          path: data/processed/
+  
+  fit-model:
+    name: Fit Model
+    runs-on: ubuntu-latest
+    timeout-minutes: 45
+    needs: [prepare-data]
+    
+    steps:
+      - uses: actions/checkout@v4
+      
+      # Reuse the fitted model if code, data and dependencies are unchanged;
+      # the nightly run always refits to check reproducibility
+      - name: Restore fitted model
+        id: model-cache
+        if: github.event_name != 'schedule'
+        uses: actions/cache/restore@v4
+        with:
+          path: results/
+          key: model-${{ hashFiles('src/**/*.py', 'scripts/prepare_data.py', 'scripts/fit_model.py', 'data/**', 'requirements.lock') }}
+      
+      - name: Set up Python
+        if: steps.model-cache.outputs.cache-hit != 'true'
+        uses: actions/setup-python@v5
+        with:
+          python-version: "3.11.9"
+          check-latest: false
+          cache: 'pip'
+          cache-dependency-path: 'requirements.lock'
+      
+      - name: Install dependencies
+        if: steps.model-cache.outputs.cache-hit != 'true'
+        run: |
+          pip install --require-hashes --no-deps -r requirements.lock
+      
+      - uses: actions/download-artifact@v4
+        if: steps.model-cache.outputs.cache-hit != 'true'
+        with:
+          name: processed-data
+          path: data/processed/
+      
+      - name: Fit model
+        if: steps.model-cache.outputs.cache-hit != 'true'
+        run: python scripts/fit_model.py --input data/processed/ --output results/
+      
+      - name: Save fitted model
+        if: steps.model-cache.outputs.cache-hit != 'true'
+        uses: actions/cache/save@v4
+        with:
+          path: results/
+          key: model-${{ hashFiles('src/**/*.py', 'scripts/prepare_data.py', 'scripts/fit_model.py', 'data/**', 'requirements.lock') }}
+      
+      - uses: actions/upload-artifact@v4
+        with:
+          name: model-results
+          path: results/
+  
+  make-plots:
+    name: Make Figures
+    runs-on: ubuntu-latest
+    timeout-minutes: 15
+    needs: [fit-model]
+    
+    steps:
+      - uses: actions/checkout@v4
+      
+      - name: Set up Python
+        uses: actions/setup-python@v5
+        with:
+          python-version: "3.11.9"
+          check-latest: false
+          cache: 'pip'
+          cache-dependency-path: 'requirements.lock'
+      
+      - name: Install dependencies
+        run: |
+          pip install --require-hashes --no-deps -r requirements.lock
+      
+      - uses: actions/download-artifact@v4
+        with:
+          name: model-results
+          path: results/
+      
+      - name: Make figures
+        run: python scripts/make_plots.py --input results/ --output figures/
+      
+      - uses: actions/upload-artifact@v4
+        with:
+          name: figures
+          path: figures/
+  
+  compare-results:
+    name: Reproducibility Check
+    runs-on: ubuntu-latest
+    timeout-minutes: 15
+    needs: [fit-model]
+    
+    steps:
+      - uses: actions/checkout@v4
+      
+      - name: Set up Python
+        uses: actions/setup-python@v5
+        with:
+          python-version: "3.11.9"
+          check-latest: false
+          cache: 'pip'
+          cache-dependency-path: 'requirements.lock'
+      
+      - name: Install dependencies
+        run: |
+          pip install --require-hashes --no-deps -r requirements.lock
+      
+      - uses: actions/download-artifact@v4
+        with:
+          name: model-results
+          path: results/
       
       - name: Compare with expected results
         run: python scripts/compare_results.py
       
       - name: Archive results
-        uses: actions/upload-artifact@v3
+        uses: actions/upload-artifact@v4
         with:
           name: analysis-results
           path: results/
 """
 
-print("Research-Specific CI Workflow:")
-print("=" * 70)
-print(research_workflow)
+show_workflow("research", "Research-Specific CI Workflow:")
 print("\n✅ Tests analysis code")
 print("✅ Executes and validates Jupyter notebooks")
 print("✅ Validates data quality")
 print("✅ Checks reproducibility of results")
 print("✅ Runs nightly to catch data issues")
 print("✅ Archives results for comparison")
+print("✅ Independent analysis stages run as parallel jobs")
+
+# %% [markdown]
+# ### A Cached Conda Environment for the Scientific Stack
+#
+# `test-analysis` does not install `numpy`, `scipy` & co. with pip. Instead,
+# [`setup-micromamba`](https://github.com/mamba-org/setup-micromamba) creates a conda environment
+# (see Lecture 4) from a pinned `environment-ci.yml`:
+#
+# ```yaml
+# # environment-ci.yml
+# name: ci
+# channels:
+#   - conda-forge
+# dependencies:
+#   - python=3.11.9
+#   - numpy=1.26.4
+#   - pandas=2.2.2
+#   - scipy=1.13.1
+#   - matplotlib=3.8.4
+#   - pytest=8.2.2
+#   - pytest-timeout=2.3.1
+#   - pytest-xdist=3.6.1
+# ```
+#
+# With `cache-environment: true`, the complete, already installed environment is cached under a hash of
+# this file. On the next run it is simply unpacked—no solver, no downloads, no installation. The
+# `bash -el {0}` shell is needed so that every `run:` step sees the activated environment.
+#
+# ### Testing Notebooks in Parallel with `nbmake`
+#
+# The `test-notebooks` job does not call `jupyter nbconvert --execute` in a loop. Instead, the
+# [nbmake](https://github.com/treebeardtech/nbmake) plugin turns every notebook into a pytest test:
+#
+# - `pytest --nbmake notebooks/` executes each notebook top to bottom and fails if any cell raises
+# - `-n auto` (from `pytest-xdist`) runs one notebook per CPU core instead of one after another—with
+#   N notebooks on a runner with K cores, the job takes roughly as long as the slowest notebooks
+#   rather than the sum of all of them
+# - `--nbmake-timeout=300` fails a notebook whose cell runs longer than 5 minutes
+# - Failures are reported like any other pytest failure, and `pytest --lf` re-runs only the
+#   notebooks that failed last time
+#
+# ### Splitting the Analysis Pipeline into Stages
+#
+# Instead of one long job running `bash scripts/run_analysis.sh`, the reproducibility check is split
+# into one job per pipeline stage. The `needs:` keyword describes which stage depends on which,
+# and artifacts carry the intermediate files from one job to the next:
+#
+# ```
+# prepare-data ──► fit-model ──┬──► make-plots
+#                              └──► compare-results
+# ```
+#
+# - Stages that depend on each other still run in order (`fit-model` waits for `prepare-data`)
+# - Stages that are independent run **at the same time** on separate runners: plotting and comparing
+#   the results both only need the fitted model, so together they take as long as the slower one
+# - If a stage fails, the log tells you immediately *which* step of the analysis broke
+# - Each stage gets its own `timeout-minutes`, matched to how long it should take
+# - All stages install the same pinned versions from `requirements.lock`, without running pip's
+#   dependency resolver (lock files are explained with the GitLab research example in Part 7)
+# - `PIP_ONLY_BINARY: ":all:"` makes every `pip install` in the workflow accept only pre-built wheels.
+#   Without it, a package version without a wheel for the runner is silently compiled from source,
+#   which can add many minutes (or fail deep inside a compiler log). With it, pip fails immediately
+#   with a clear message. A package that really has to be built can be exempted with
+#   `--no-binary <package>`
+# - `fit-model`, the most expensive stage, caches its `results/` under a hash of everything the fit
+#   depends on (`src/`, the two scripts, `data/`, `requirements.lock`). If none of these changed—say, only
+#   the plotting script was edited—the model is restored in seconds instead of being refitted. The
+#   nightly `schedule` run skips the cache on purpose: recomputing from scratch is the whole point of
+#   a reproducibility check
+#
+# ### Skipping the Pipeline for Unrelated Changes
+#
+# Fixing a typo in `README.md` cannot change any result, yet without a filter it would execute every
+# notebook and refit the model. The `paths:` filter starts the workflow only if a commit touches one of
+# the listed files or folders. The list is written once and reused for pull requests with a YAML anchor
+# (`&analysis-paths`, referenced as `*analysis-paths`). The nightly `schedule:` is not affected by
+# `paths:` and still runs every night. If you make such a workflow a required check, note that a
+# skipped workflow never reports a status—the merge would be blocked.
 
 # %% [markdown]
 # ## Part 7: GitLab CI/CD
@@ -715,33 +1286,44 @@ print("✅ Archives results for comparison")
 # ### Basic GitLab CI Example
 
 # %%
-gitlab_basic = """
+WORKFLOWS["gitlab_basic"] = """
 # GitLab CI configuration for temperature module
 
-# Define pipeline stages
+# Define pipeline stages; jobs in the same stage run in parallel
 stages:
-  - test
-  - quality
+  - verify  # test and lint
   - build
 
+# Let pip store its downloads inside the project, where GitLab can cache them
+variables:
+  PIP_CACHE_DIR: "$CI_PROJECT_DIR/.cache/pip"
+
+cache:
+  key:
+    files:
+      - requirements.txt
+  paths:
+    - .cache/pip
+
 # Default settings for all jobs
 default:
   image: python:3.11
+  timeout: 15 minutes  # Instead of the project default of 1 hour
   before_script:
     - python -m pip install --upgrade pip
-    - pip install pytest pytest-cov
+    - pip install pytest pytest-cov pytest-xdist
 
 # Job: Run tests
 test:
-  stage: test
+  stage: verify
   script:
     - pip install -r requirements.txt
-    - pytest --cov=src --cov-report=term tests/
+    - pytest -n auto --dist loadfile --cov=src --cov-report=term tests/
   coverage: '/(?i)total.*? (100(?:\\.0+)?\\%|[1-9]?\\d(?:\\.\\d+)?\\%)$/'
 
 # Job: Code quality check
 lint:
-  stage: quality
+  stage: verify
   before_script:
     - pip install flake8 black
   script:
@@ -760,9 +1342,17 @@ build:
       - dist/
 """
 
-print("GitLab CI Configuration:")
-print("=" * 70)
-print(gitlab_basic)
+show_workflow("gitlab_basic", "GitLab CI Configuration:")
+
+# %% [markdown]
+# **Stages:** GitLab runs the stages one after another, and all jobs of one stage in parallel. Linting
+# does not need the test results, so `test` and `lint` share the `verify` stage: the pipeline takes
+# as long as the slower of the two plus `build`, instead of the sum of all three. Only put jobs into
+# a later stage if they really depend on an earlier one.
+#
+# **Timeouts:** `timeout: 15 minutes` under `default:` is GitLab's counterpart to GitHub's
+# `timeout-minutes` and applies to every job. The later GitLab examples set it per job—longer for
+# the analysis, shorter for unit tests.
 
 # %% [markdown]
 # ### Key Differences: GitLab vs GitHub Actions
@@ -775,41 +1365,62 @@ print(gitlab_basic)
 # | Marketplace | Yes (actions) | No (but has includes) |
 # | Self-hosted | Yes (runners) | Yes (runners) |
 # | Matrix builds | Built-in | Via parallel keyword |
+# | Dependency cache | `cache: 'pip'` in `setup-python` | `cache:` + `PIP_CACHE_DIR` |
 
 # %% [markdown]
 # ### Advanced GitLab CI Features
 
 # %%
-gitlab_advanced = """
+WORKFLOWS["gitlab_advanced"] = """
 # Advanced GitLab CI configuration
 
 stages:
-  - quality
-  - test
+  - prepare
+  - verify  # code quality and tests in parallel
   - deploy
 
 # Variables available to all jobs
 variables:
   PIP_CACHE_DIR: "$CI_PROJECT_DIR/.cache/pip"
 
-# Cache pip packages
+# Cache pip downloads; the key changes whenever requirements.txt changes
 cache:
+  key:
+    files:
+      - requirements.txt
   paths:
     - .cache/pip
 
-# Template for Python jobs
+# Build one CI image per Python version with all test and lint tools installed,
+# weekly (scheduled pipeline) and whenever the Dockerfile changes
+build-ci-image:
+  stage: prepare
+  image: docker:24
+  timeout: 30 minutes
+  services:
+    - docker:24-dind
+  parallel:
+    matrix:
+      - PYTHON_VERSION: ["3.9", "3.10", "3.11", "3.12"]
+  script:
+    - docker login -u "$CI_REGISTRY_USER" -p "$CI_REGISTRY_PASSWORD" "$CI_REGISTRY"
+    - docker build -f .ci/Dockerfile --build-arg PYTHON_VERSION=$PYTHON_VERSION -t "$CI_REGISTRY_IMAGE/ci-python:$PYTHON_VERSION" .
+    - docker push "$CI_REGISTRY_IMAGE/ci-python:$PYTHON_VERSION"
+  rules:
+    - if: $CI_PIPELINE_SOURCE == "schedule"
+    - changes:
+        - .ci/Dockerfile
+
+# Template for Python jobs: the tools are already in the image, nothing to install
 .python-job:
-  image: python:3.11
-  before_script:
-    - python -m pip install --upgrade pip
-    - pip install pytest pytest-cov
+  image: $CI_REGISTRY_IMAGE/ci-python:3.11
+  interruptible: true  # May be cancelled when a newer pipeline starts on the same branch
+  timeout: 15 minutes
 
 # Code quality job
 code-quality:
   extends: .python-job
-  stage: quality
-  before_script:
-    - pip install flake8 black isort
+  stage: verify
   script:
     - isort --check-only src/ tests/
     - black --check src/ tests/
@@ -819,38 +1430,37 @@ code-quality:
 # Test on multiple Python versions
 .test-template:
   extends: .python-job
-  stage: test
+  stage: verify
+  rules:
+    - changes:  # Skip the tests when only documentation changed
+        - src/**/*
+        - tests/**/*
+        - requirements.txt
   script:
     - pip install -r requirements.txt
-    - pytest --cov=src --cov-report=term --cov-report=xml tests/
+    - pytest -n auto --dist loadfile --cov=src --cov-report=term --cov-report=xml --junitxml=report.xml tests/
   coverage: '/(?i)total.*? (100(?:\\.0+)?\\%|[1-9]?\\d(?:\\.\\d+)?\\%)$/'
   artifacts:
+    when: always  # Upload the reports of failed runs too
     reports:
       coverage_report:
         coverage_format: cobertura
         path: coverage.xml
+      junit: report.xml  # Failed tests appear in the merge request
 
-# Matrix: Test on Python 3.9, 3.10, 3.11, 3.12
-test-python-3.9:
-  extends: .test-template
-  image: python:3.9
-
-test-python-3.10:
-  extends: .test-template
-  image: python:3.10
-
-test-python-3.11:
-  extends: .test-template
-  image: python:3.11
-
-test-python-3.12:
+# Matrix: one job definition, run in parallel on Python 3.9, 3.10, 3.11, 3.12
+test:
   extends: .test-template
-  image: python:3.12
+  image: $CI_REGISTRY_IMAGE/ci-python:$PYTHON_VERSION
+  parallel:
+    matrix:
+      - PYTHON_VERSION: ["3.9", "3.10", "3.11", "3.12"]
 
 # Deploy documentation (only on main branch)
 pages:
   stage: deploy
   image: python:3.11
+  timeout: 15 minutes
   script:
     - pip install sphinx sphinx-rtd-theme
     - cd docs && make html
@@ -862,55 +1472,144 @@ pages:
     - main
 """
 
-print("Advanced GitLab CI Configuration:")
-print("=" * 70)
-print(gitlab_advanced)
+show_workflow("gitlab_advanced", "Advanced GitLab CI Configuration:")
 print("\n✅ Job templates (.python-job)")
+print("✅ Pre-built CI images with all tools installed")
 print("✅ Caching for faster builds")
-print("✅ Multiple Python versions")
+print("✅ Multiple Python versions (parallel:matrix)")
 print("✅ Coverage reports")
+print("✅ Test reports in merge requests (JUnit XML)")
 print("✅ Conditional deployment")
 
+# %% [markdown]
+# **Matrix jobs in GitLab:** `parallel: matrix:` is GitLab's counterpart to GitHub's `strategy.matrix`.
+# GitLab creates one job per value of `PYTHON_VERSION` (shown as `test: [3.9]`, `test: [3.10]`, ...) and
+# runs them in parallel, each in the prebuilt `$CI_REGISTRY_IMAGE/ci-python:$PYTHON_VERSION` image for
+# that version (built by `build-ci-image`, see below). Compared with writing four near-identical jobs by hand, all versions are guaranteed to share the same settings, and testing a new Python
+# release is a one-word change. A second variable in the same matrix entry adds another axis.
+#
+# **Covering other operating systems:** GitLab's shared Docker runners are all Linux, so this matrix never
+# sees Windows path separators or macOS encoding defaults. If that matters for your code, the `test` job
+# of the complete GitHub workflow above is the simplest route: a matrix over 3 OS runners, each of which
+# installs all four Python versions and runs them through `tox run-parallel`:
+#
+# ```yaml
+# strategy:
+#   fail-fast: false   # One failing platform does not cancel the other runners
+#   matrix:
+#     os: [ubuntu-latest, windows-latest, macos-latest]
+# runs-on: ${{ matrix.os }}
+# ```
+#
+# That covers all 12 OS × Python combinations with just 3 runners; the wall-clock time is that of
+# the slowest runner.
+#
+# **Caching in GitLab:** GitLab only caches what you list under `cache: paths:`, and only paths inside
+# the project directory. Setting `PIP_CACHE_DIR` makes pip store its downloads in `.cache/pip` inside
+# the project, exactly where the cache expects them—if the two paths don't match, the cache is saved
+# but never used. `key: files: [requirements.txt]` ties the cache to the content of that file, so
+# outdated wheels are dropped automatically when dependencies change. Cache only the download
+# directory, not installed `site-packages`: restoring a stale installation causes hard-to-debug errors.
+#
+# **Tools baked into the image:** Every job used to start from a bare `python:` image and install
+# `pytest`, `flake8` & co. first—four times over in the matrix. `build-ci-image` bakes these tools into
+# one image per Python version, stored in the project's container registry:
+#
+# ```dockerfile
+# # .ci/Dockerfile
+# ARG PYTHON_VERSION=3.11
+# FROM python:${PYTHON_VERSION}-slim
+# RUN pip install --no-cache-dir pytest pytest-cov pytest-xdist flake8 black isort
+# ```
+#
+# The jobs then start with everything in place and only install the project's own `requirements.txt`.
+# The image is rebuilt weekly by a scheduled pipeline to pick up tool updates.
+#
+# **Cancelling outdated pipelines:** GitLab's counterpart to GitHub's `concurrency:` is
+# `interruptible: true`. With the project setting *Auto-cancel redundant pipelines* (on by default),
+# a new push cancels interruptible jobs of older pipelines on the same branch. Only mark jobs that
+# are safe to stop halfway—tests and linting, not deployments like `pages`.
+#
+# **Test reports:** `--junitxml=report.xml` makes pytest write its results in the JUnit XML format.
+# Declared under `artifacts: reports: junit:`, GitLab reads the file and lists failed tests, with their
+# error messages, directly in the merge request—no scrolling through job logs. `when: always` matters:
+# by default, artifacts are only uploaded by successful jobs, and the report is most useful when tests
+# fail. Writing the file costs nothing measurable.
+
 # %% [markdown]
 # ### Research-Specific GitLab CI
 
 # %%
-gitlab_research = """
+WORKFLOWS["gitlab_research"] = """
 # GitLab CI for research projects
 
 stages:
-  - quality
+  - prepare
   - test
   - analysis
   - report
 
 variables:
   DATA_DIR: "/data/shared"  # Mount point for research data
+  PIP_CACHE_DIR: "$CI_PROJECT_DIR/.cache/pip"
+  PIP_ONLY_BINARY: ":all:"  # Never build packages from source in CI
 
-# Quality checks
-code-quality:
-  stage: quality
-  image: python:3.11
+# Cache pip downloads for all jobs, keyed on the locked dependency list
+cache:
+  key:
+    files:
+      - requirements.lock
+  paths:
+    - .cache/pip
+
+# Rebuild the CI image with the scientific stack, only when its inputs change
+build-image:
+  stage: prepare
+  image: docker:24
+  timeout: 30 minutes
+  services:
+    - docker:24-dind
   script:
-    - pip install flake8
-    - flake8 src/ --max-line-length=100
+    - docker login -u "$CI_REGISTRY_USER" -p "$CI_REGISTRY_PASSWORD" "$CI_REGISTRY"
+    - docker build -f .ci/Dockerfile -t "$CI_REGISTRY_IMAGE:ci-py311" .
+    - docker push "$CI_REGISTRY_IMAGE:ci-py311"
+  only:
+    changes:
+      - .ci/Dockerfile
+      - requirements.lock
 
-# Unit tests
+# Linting and unit tests share one job: one image pull, one checkout, one install
 unit-tests:
   stage: test
   image: python:3.11
+  timeout: 15 minutes
   script:
-    - pip install pytest pytest-cov numpy pandas
-    - pytest tests/unit/ -v --cov=src
+    - pip install ruff pytest pytest-cov pytest-xdist numpy pandas
+    - ruff check --select E,W,F --line-length 100 src/  # flake8's rule set, incl. line length; no cache needed
+    - pytest tests/unit/ -v -n auto --dist loadfile --cov=src --junitxml=report.xml
   coverage: '/TOTAL.*? (100(?:\\.0+)?\\%|[1-9]?\\d(?:\\.\\d+)?\\%)$/'
+  artifacts:
+    when: always
+    reports:
+      junit: report.xml
+    expire_in: 1 week
 
-# Integration tests (may need real data)
+# Integration tests (may need real data), fast and slow ones as two parallel jobs
 integration-tests:
   stage: test
-  image: python:3.11
+  image: $CI_REGISTRY_IMAGE:ci-py311  # numpy, scipy, ... already installed
+  timeout: 30 minutes
+  parallel:
+    matrix:
+      - MARK: ["not slow", "slow"]
   script:
-    - pip install pytest numpy pandas scipy matplotlib
-    - pytest tests/integration/ -v
+    # Exit code 5 means no test matched the marker (e.g. no slow tests yet); that is not a failure
+    - pytest tests/integration/ -v -n auto --dist worksteal -m "$MARK" --junitxml=report.xml || [ $? -eq 5 ]
+  artifacts:
+    when: always
+    reports:
+      junit: report.xml
+    expire_in: 1 week
   only:
     - main
     - develop
@@ -918,9 +1617,9 @@ integration-tests:
 # Run full analysis pipeline
 run-analysis:
   stage: analysis
-  image: python:3.11
+  image: $CI_REGISTRY_IMAGE:ci-py311
+  timeout: 60 minutes
   script:
-    - pip install -r requirements.txt
     - python scripts/run_analysis.py --data-dir $DATA_DIR
   artifacts:
     paths:
@@ -928,44 +1627,144 @@ run-analysis:
     expire_in: 30 days
   only:
     - main
+  except:
+    - schedules  # The nightly pipeline reuses these results instead (nightly-check)
 
 # Generate report
 generate-report:
   stage: report
   image: python:3.11
-  dependencies:
-    - run-analysis
+  timeout: 30 minutes
+  # Start as soon as run-analysis is done and fetch its results/ artifacts
+  needs:
+    - job: run-analysis
+      artifacts: true
   script:
-    - pip install jupyter nbconvert
-    - jupyter nbconvert --to html --execute notebooks/report.ipynb
+    - pip install jupyter nbconvert nbmake pytest-xdist  # Wheels come from the shared pip cache
+    # Execute all notebooks in parallel and save their outputs in place ...
+    - pytest --nbmake -n auto --overwrite notebooks/
+    # ... then only convert the already executed notebooks to HTML
+    - for nb in notebooks/*.ipynb; do jupyter nbconvert --to html "$nb"; done
   artifacts:
     paths:
-      - notebooks/report.html
+      - notebooks/*.html
     expire_in: 1 year
   only:
     - main
+  except:
+    - schedules  # Needs run-analysis, which is skipped in scheduled pipelines
 
-# Nightly reproducibility check
+# Nightly reproducibility check: compare the latest results from main with the baseline
+# and only rerun the analysis if they do not match
 nightly-check:
   stage: analysis
-  image: python:3.11
+  image: $CI_REGISTRY_IMAGE:ci-py311  # Comparison needs only the pre-installed stack
+  timeout: 60 minutes
   script:
-    - pip install -r requirements.txt
-    - python scripts/run_analysis.py --data-dir $DATA_DIR
-    - python scripts/compare_with_baseline.py
+    - >
+      curl --fail --location --header "JOB-TOKEN: $CI_JOB_TOKEN"
+      "$CI_API_V4_URL/projects/$CI_PROJECT_ID/jobs/artifacts/main/download?job=run-analysis"
+      --output artifacts.zip
+    - python -m zipfile -e artifacts.zip .
+    - >
+      python scripts/compare_with_baseline.py ||
+      (pip install --require-hashes --no-deps -r requirements.lock &&
+      python scripts/run_analysis.py --data-dir $DATA_DIR && python scripts/compare_with_baseline.py)
   only:
     - schedules
 """
 
-print("Research-Specific GitLab CI:")
-print("=" * 70)
-print(gitlab_research)
-print("\n✅ Separate unit and integration tests")
+show_workflow("gitlab_research", "Research-Specific GitLab CI:")
+print("\n✅ Separate unit and integration tests (slow tests in their own parallel job)")
 print("✅ Full analysis pipeline")
-print("✅ Automated report generation")
+print("✅ Automated report generation (notebooks executed in parallel)")
 print("✅ Scheduled reproducibility checks")
+print("✅ Cached pip downloads")
+print("✅ Pre-built image for the heavy scientific stack")
 print("✅ Artifact preservation")
 
+# %% [markdown]
+# **Pre-built CI images:** Installing `scipy` and `matplotlib` downloads and unpacks large wheels, and
+# `integration-tests` and `run-analysis` did that on every single pipeline. Dependencies change rarely,
+# though, so it pays off to install them *once* into a project-specific Docker image and let jobs
+# start from that image:
+#
+# ```dockerfile
+# # .ci/Dockerfile
+# FROM python:3.11-slim
+# # curl for nightly-check's artifact download (the slim image does not ship it)
+# RUN apt-get update && apt-get install -y --no-install-recommends curl && rm -rf /var/lib/apt/lists/*
+# COPY requirements.lock .
+# RUN pip install --no-cache-dir --require-hashes --no-deps -r requirements.lock
+# ```
+#
+# The `build-image` job rebuilds and pushes this image to the project's GitLab container registry
+# (`$CI_REGISTRY_IMAGE`) only when `.ci/Dockerfile` or `requirements.lock` change—because it runs in the
+# first stage, the jobs in later stages of the same pipeline already get the updated image. All other
+# pipelines simply pull the finished image: the install step disappears from the jobs entirely.
+# Lecture 9 covers Docker and writing Dockerfiles in detail.
+#
+# **Lock files:** With a plain `requirements.txt`, pip has to *resolve* the dependencies on every
+# install—find versions of all packages and their dependencies that fit together. For a large scientific
+# stack this takes a while, and the result may differ from one week to the next. Instead, the direct
+# dependencies (including `pytest` and `pytest-xdist`) go into `requirements.in`, and a developer
+# resolves them once into a fully pinned `requirements.lock`:
+#
+# ```bash
+# pip install pip-tools
+# pip-compile --generate-hashes requirements.in -o requirements.lock
+# # or: uv pip compile --generate-hashes requirements.in -o requirements.lock
+# ```
+#
+# CI then installs exactly these versions with `pip install --require-hashes --no-deps -r requirements.lock`,
+# skipping the resolver. The hashes additionally guarantee that every downloaded file is bit-for-bit the
+# one that was locked. The analysis jobs of the GitHub research workflow above install the same way. The lock file is committed, so it also serves as the cache key: caches and the CI image are
+# rebuilt exactly when a pinned version changes.
+#
+# **`needs:` instead of waiting for whole stages:** By default, a GitLab job starts only after *every*
+# job of the previous stage has finished. `generate-report` declares `needs: [run-analysis]`
+# (with `artifacts: true` to receive the `results/` folder), which turns the pipeline into a graph:
+# the report starts the moment the analysis finishes, even if other jobs are still running. Like
+# every other job, it only caches pip's downloads: a cached virtual environment would outlive
+# changes to the `python:3.11` image it was built with.
+#
+# **Fewer, fuller jobs:** Every job pays a fixed price before doing anything useful—pull the image,
+# clone the repository, restore caches, install packages. For a linter that runs in two seconds,
+# that overhead dominates. Here, the linter therefore runs at the start of `unit-tests`, which needs the
+# same image and checkout anyway. The linter is [`ruff`](https://docs.astral.sh/ruff/), written in Rust,
+# which lints a whole project in well under a second, so there is nothing left to cache. Its default
+# rule set is narrower than flake8's and leaves out the pycodestyle style checks, including line length
+# (E501)—`--select E,W,F` turns on the same pycodestyle (`E`, `W`) and pyflakes (`F`) rules that
+# `flake8` runs, so `--line-length 100` actually takes effect. Separate jobs are still the right choice when they need different
+# environments or rules—like `integration-tests`, which only runs on `main` and `develop`.
+#
+# **Balancing slow tests:** A few integration tests (fitting a model, rendering many plots) often take
+# far longer than the rest. With `--dist loadfile`, the worker that draws the file with these tests
+# keeps running long after all other workers are idle. Two changes remove this tail:
+#
+# - `--dist worksteal` lets idle workers take over tests still queued at busy ones.
+# - Slow tests are marked with `@pytest.mark.slow`, and the `MARK` matrix runs `-m "not slow"` and
+#   `-m "slow"` as two separate jobs in parallel, possibly on different runners.
+#
+# If no test carries the marker (yet), the `-m "slow"` leg collects nothing, and pytest exits with
+# code 5 ("no tests collected"), which would fail the job. The `|| [ $? -eq 5 ]` after the pytest call
+# accepts exactly this exit code and still fails on real test failures (code 1) and errors.
+#
+# The marker has to be registered, e.g. in `pytest.ini`:
+#
+# ```ini
+# [pytest]
+# markers =
+#     slow: long-running integration tests
+# ```
+#
+# **Reuse results instead of recomputing them:** `run-analysis` already stores `results/` as an
+# artifact of every pipeline on `main`. The nightly job therefore downloads the latest of these
+# artifacts through GitLab's API and compares them with the baseline. Only if the comparison fails does
+# it install the locked dependencies and rerun the analysis from scratch—to tell a real reproducibility
+# problem apart from outdated results. `run-analysis` and `generate-report` carry `except: [schedules]`,
+# so on a normal night the expensive analysis does not run at all.
+
 # %% [markdown]
 # ## Part 8: CI Best Practices for Research
 #
@@ -1010,18 +1809,20 @@ print("✅ Artifact preservation")
 # **Example timing:**
 
 # %%
-test_timing_example = """
+WORKFLOWS["test_timing"] = """
 # Fast tests (run on every commit)
 fast-tests:
   stage: test
+  timeout: 15 minutes
   script:
-    - pytest tests/unit/ -v  # < 1 minute
+    - pytest tests/unit/ -v -n auto  # < 1 minute
   
 # Slow tests (run only on main/PR)
 integration-tests:
   stage: test
+  timeout: 30 minutes
   script:
-    - pytest tests/integration/ -v  # 5-10 minutes
+    - pytest tests/integration/ -v -n auto  # 5-10 minutes
   only:
     - main
     - merge_requests
@@ -1029,15 +1830,30 @@ integration-tests:
 # Very slow tests (run nightly)
 full-analysis:
   stage: test
+  timeout: 2 hours  # Raised above the 1-hour project default, which this job exceeds
   script:
     - bash scripts/run_full_analysis.sh  # 1+ hours
   only:
     - schedules
 """
 
-print("Test Timing Strategy:")
-print("=" * 70)
-print(test_timing_example)
+show_workflow("test_timing", "Test Timing Strategy:")
+
+# %% [markdown]
+# **Parallel execution with `pytest-xdist`:** By default, pytest runs one test after another on a single
+# CPU core, while CI runners have 2–4 cores. With the `pytest-xdist` plugin installed,
+# `pytest -n auto` starts one worker process per core and distributes the tests among them—typically
+# a 2–4× shorter test step with no other changes. That is why the pytest calls in this lecture's
+# examples use `-n auto`:
+#
+# - `--dist loadfile` sends all tests from one file to the same worker, so expensive module-level
+#   fixtures are set up once per file instead of once per worker
+# - `pytest-cov` works with `pytest-xdist` out of the box and merges the coverage data of all workers
+# - Tests must be independent of each other (no shared temporary files, no reliance on execution
+#   order)—a good property to have anyway
+#
+# Parallel workers inside one job complement matrix jobs: the matrix spreads configurations over
+# many runners, `-n auto` uses every core of each runner.
 
 # %% [markdown]
 # ### 3. Protect Important Branches
@@ -1117,7 +1933,7 @@ print(test_timing_example)
 # Let's see how CI would have prevented our Lecture 5 disaster:
 
 # %%
-complete_example = '''
+WORKFLOWS["complete_example"] = '''
 # GitHub Actions workflow: .github/workflows/ci.yml
 name: Temperature Module CI
 
@@ -1127,10 +1943,16 @@ on:
   pull_request:
     branches: [ main ]
 
+# A new push to the same PR cancels the run that is still in progress
+concurrency:
+  group: ${{ github.workflow }}-${{ github.event.pull_request.number || github.ref }}
+  cancel-in-progress: ${{ github.event_name == 'pull_request' }}
+
 jobs:
   test:
     name: Test Suite
     runs-on: ubuntu-latest
+    timeout-minutes: 15  # Fail fast instead of GitHub's 6-hour default
     
     steps:
       - name: Check out code
@@ -1139,23 +1961,39 @@ jobs:
       - name: Set up Python
         uses: actions/setup-python@v5
         with:
-          python-version: "3.11"
+          python-version: "3.11.9"
+          check-latest: false
+          cache: 'pip'  # Restore downloaded wheels, keyed on both requirements files
+          cache-dependency-path: |
+            requirements.txt
+            requirements-dev.txt
       
+      # No "pip install --upgrade pip": the runner's pip is recent enough
       - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install pytest pytest-cov
+        run: pip install -r requirements.txt -r requirements-dev.txt
       
       - name: Run tests
         run: |
-          pytest tests/ -v --cov=src --cov-report=term-missing
+          pytest tests/ -v -n auto --dist loadfile --cov=src --cov-report=term-missing --junitxml=report.xml
+      
+      - name: Upload test report
+        if: always()  # Especially when tests failed
+        uses: actions/upload-artifact@v4
+        with:
+          name: test-report
+          path: report.xml
       
       - name: Ensure minimum coverage
         run: |
           coverage report --fail-under=80
 
-# Requirements file: requirements.txt
-# (empty for this simple project)
+# Requirements file: requirements.txt (what the module itself needs to run)
+# -- no runtime dependencies yet --
+
+# Requirements file: requirements-dev.txt (tools for testing and development)
+pytest
+pytest-cov
+pytest-xdist
 
 # Test file: tests/test_temperature.py
 """
@@ -1188,15 +2026,40 @@ class TestTemperatureConversion:
 """
 '''
 
-print("Complete Automated Temperature Project:")
-print("=" * 70)
-print(complete_example)
+show_workflow("complete_example", "Complete Automated Temperature Project:")
 print("\n✅ Tests run automatically on every push")
 print("✅ Tests run on every pull request")
 print("✅ Requires 80% coverage")
+print("✅ Caches pip downloads between runs")
+print("✅ Cancels outdated runs when new commits are pushed")
 print("✅ Any bug in conversion would be caught immediately")
 print("✅ Could NOT publish with broken code")
 
+# %% [markdown]
+# **Built-in dependency caching:** The `cache: 'pip'` input of `actions/setup-python` is all it takes
+# to stop re-downloading `pytest` and `pytest-cov` on every push. The action saves pip's download cache
+# at the end of a run and restores it at the start of the next one, under a key derived from the hash
+# of `cache-dependency-path`. That is why the test tools are listed in `requirements-dev.txt` instead of
+# being installed by name: together with `requirements.txt`, the file gives the cache a stable key, and
+# the key changes exactly when the dependencies do. Do not add a separate `actions/cache` step for
+# `~/.cache/pip` on top—the same cache would be saved twice. On larger projects, this alone often cuts
+# CI time in half.
+#
+# **Cancelling superseded runs:** Pushing three quick fixes to a pull request starts three complete
+# runs, although only the result of the last one matters. The `concurrency:` block puts all runs of
+# this workflow for the same PR (or, for pushes, the same branch) into one group, and a new run cancels
+# the older one still in progress. This frees runners for other work and keeps outdated runs from
+# writing to the cache. The condition on `cancel-in-progress` limits this to pull requests: every
+# push to `main` still gets a complete run, so its history of results stays intact. All GitHub
+# workflows in this lecture use this block.
+#
+# **Skipping CI for documentation:** It is tempting to add `paths-ignore: ['**.md', 'docs/**']` to the
+# `on:` triggers, so that a README typo does not start the test suite. But a skipped workflow reports no
+# status at all, so a branch protection rule that requires "Test Suite" would keep such a pull request
+# waiting forever. Only use `paths-ignore` on workflows that are not required checks; the complete
+# workflow in Part 5 instead skips individual jobs behind an always-running `changes` job. In GitLab,
+# the same is done per job with `rules: - changes:`, as in the `.test-template` of the advanced example.
+
 # %% [markdown]
 # ### How CI Prevents Disasters
 #
@@ -143,14 +143,19 @@
 
 
 # %%
+import numpy as np
+
+
 def calculate_anomalies(temperatures, baseline):
     """
     Calculate temperature anomalies relative to a baseline.
 
     Parameters
     ----------
-    temperatures : list
-        Temperature readings in Celsius
+    temperatures : array_like
+        Temperature readings in Celsius, processed as float32 (ample for
+        readings with a few significant digits, and half the memory of float64).
+        A float32 NumPy array is used as is, without a copy.
     baseline : float
         Baseline temperature for comparison
 
@@ -159,21 +164,17 @@ def calculate_anomalies(temperatures, baseline):
     dict
         Statistics about the anomalies
     """
-    anomalies = []
-
-    for temp in temperatures:
-        anomaly = temp - baseline
-        anomalies.append(anomaly)
+    # One NumPy operation for all readings instead of a Python loop
+    anomalies = np.asarray(temperatures, dtype=np.float32) - baseline
 
-    # Calculate statistics
-    mean_anomaly = sum(anomalies) / len(anomalies)
-    max_anomaly = max(anomalies)
-    min_anomaly = min(anomalies)
+    # Calculate statistics (accumulate the sum in float64 to avoid rounding errors)
+    mean_anomaly = float(anomalies.mean(dtype=np.float64))
+    max_anomaly = float(anomalies.max())
+    min_anomaly = float(anomalies.min())
 
     # BUG: This calculation is wrong when there are negative anomalies
     anomaly_range = max_anomaly - min_anomaly
-    positive_anomalies = [a for a in anomalies if a > 0]
-    fraction_positive = len(positive_anomalies) / len(anomalies)
+    fraction_positive = float((anomalies > 0).mean())
 
     return {
         "mean": mean_anomaly,
@@ -184,8 +185,8 @@ def calculate_anomalies(temperatures, baseline):
     }
 
 
-# Test with sample data
-temps = [15.2, 16.8, 14.5, 17.3, 15.9, 16.1]
+# Test with sample data (a NumPy array stores plain numbers side by side, a list stores pointers to float objects)
+temps = np.array([15.2, 16.8, 14.5, 17.3, 15.9, 16.1], dtype=np.float32)
 baseline_temp = 16.0
 
 result = calculate_anomalies(temps, baseline_temp)
@@ -291,7 +292,7 @@ def analyze_temperature_trends(daily_temps, window_size=7):
 
     Parameters
     ----------
-    daily_temps : list
+    daily_temps : array_like
         Daily temperature readings
     window_size : int
         Number of days for moving average
@@ -304,29 +305,32 @@ def analyze_temperature_trends(daily_temps, window_size=7):
     if len(daily_temps) < window_size:
         raise ValueError(f"Need at least {window_size} days of data")
 
-    # Calculate moving averages
-    moving_averages = []
-    for i in range(len(daily_temps) - window_size + 1):
-        window = daily_temps[i : i + window_size]
-        avg = sum(window) / window_size
-        moving_averages.append(avg)
+    # Calculate moving averages from a cumulative sum: each window sum is the
+    # difference of two running totals, so the cost no longer grows with window_size
+    running_total = np.concatenate(([0.0], np.cumsum(daily_temps, dtype=np.float64)))
+    moving_averages = (running_total[window_size:] - running_total[:-window_size]) / window_size
 
     # Calculate trend (slope of moving averages)
     # BUG: This fails when moving_averages has only 1 element
     n = len(moving_averages)
     if n < 2:
-        return {"trend": 0.0, "moving_avg": moving_averages[0]}
+        return {"trend": 0.0, "moving_avg": float(moving_averages[0])}
 
-    # Simple linear regression slope
-    x_mean = (n - 1) / 2.0
-    y_mean = sum(moving_averages) / n
+    # Simple linear regression slope for x = 0, 1, ..., n-1 in one vectorized pass
+    x_centered = np.arange(n) - (n - 1) / 2.0
+    y_centered = moving_averages - moving_averages.mean()
 
-    numerator = sum((i - x_mean) * (y - y_mean) for i, y in enumerate(moving_averages))
-    denominator = sum((i - x_mean) ** 2 for i in range(n))
+    numerator = x_centered @ y_centered
+    denominator = n * (n**2 - 1) / 12.0  # Closed form of sum((x - x_mean)**2), > 0 for n >= 2
 
-    trend = numerator / denominator if denominator != 0 else 0.0
+    trend = numerator / denominator
 
-    return {"trend": trend, "moving_avg_start": moving_averages[0], "moving_avg_end": moving_averages[-1], "data_points": n}
+    return {
+        "trend": float(trend),
+        "moving_avg_start": float(moving_averages[0]),
+        "moving_avg_end": float(moving_averages[-1]),
+        "data_points": n,
+    }
 
 
 # Test with different datasets
@@ -366,7 +370,7 @@ print(f"  Trend: {result3['trend']:.4f}°C/day")
 # **In the debugger:**
 # ```
 # (Pdb) p moving_averages
-# [23.0]  # Only one element!
+# array([23.])  # Only one element!
 #
 # (Pdb) p len(moving_averages)
 # 1
@@ -490,15 +494,52 @@ import logging
 logger = logging.getLogger("climate_analysis")
 logger.setLevel(logging.DEBUG)
 
-# Create console handler with formatting
-console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.INFO)
-formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s", datefmt="%H:%M:%S")
-console_handler.setFormatter(formatter)
-logger.addHandler(console_handler)
+# Create console handler with formatting. The guard keeps re-running this cell from adding
+# a second handler, which would print every message twice.
+if not logger.handlers:
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.INFO)
+    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s", datefmt="%H:%M:%S")
+    console_handler.setFormatter(formatter)
+    logger.addHandler(console_handler)
+
+# Don't also pass records on to the root logger configured by basicConfig above
+logger.propagate = False
 
 
-def process_climate_data(station_data, quality_threshold=0.8):
+def _to_soa(station_data):
+    """
+    Rearrange per-station dictionaries into parallel arrays (struct of arrays).
+
+    Parameters
+    ----------
+    station_data : dict
+        Data from climate stations
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        Station IDs, quality scores (NaN where missing) and number of readings
+    """
+    n_stations = len(station_data)
+    # dtype=object keeps the keys as they are (ints stay ints) instead of casting them to strings
+    station_ids = np.array(list(station_data), dtype=object)
+    qualities = np.empty(n_stations, dtype=np.float64)
+    n_readings = np.empty(n_stations, dtype=np.int64)
+
+    # One pass over the stations, looking up each field only once
+    for i, data in enumerate(station_data.values()):
+        quality = data.get("quality")
+        temperatures = data.get("temperatures")
+        if temperatures is None:
+            temperatures = ()
+        qualities[i] = np.nan if quality is None else quality
+        n_readings[i] = len(temperatures)
+
+    return station_ids, qualities, n_readings
+
+
+def process_climate_data(station_data, quality_threshold=0.8, verbose=True):
     """
     Process climate station data with comprehensive logging.
 
@@ -508,6 +549,9 @@ def process_climate_data(station_data, quality_threshold=0.8):
         Data from climate stations
     quality_threshold : float
         Minimum quality score to accept data
+    verbose : bool
+        Log a DEBUG message for every accepted station; pass False to skip
+        the per-station loop on large inputs
 
     Returns
     -------
@@ -516,32 +560,31 @@ def process_climate_data(station_data, quality_threshold=0.8):
     """
     logger.info(f"Starting climate data processing for {len(station_data)} stations")
 
-    valid_stations = []
-    rejected_stations = []
+    # Check all stations at once with array masks instead of one loop iteration per station
+    station_ids, qualities, n_readings = _to_soa(station_data)
 
-    for station_id, data in station_data.items():
-        logger.debug(f"Processing station {station_id}")
+    missing_quality = np.isnan(qualities)
+    for station_id in station_ids[missing_quality]:
+        logger.warning("Station %s missing quality metadata, assuming 1.0", station_id)
+    qualities[missing_quality] = 1.0
 
-        # Check data quality
-        if "quality" not in data:
-            logger.warning(f"Station {station_id} missing quality metadata, assuming 1.0")
-            data["quality"] = 1.0
+    low_quality = qualities < quality_threshold
+    for station_id, quality in zip(station_ids[low_quality], qualities[low_quality]):
+        logger.warning("Station %s rejected: quality %.2f below threshold %.2f", station_id, quality, quality_threshold)
 
-        if data["quality"] < quality_threshold:
-            logger.warning(
-                f"Station {station_id} rejected: quality {data['quality']:.2f} " f"below threshold {quality_threshold:.2f}"
-            )
-            rejected_stations.append(station_id)
-            continue
+    # Check for missing data
+    no_data = ~low_quality & (n_readings == 0)
+    for station_id in station_ids[no_data]:
+        logger.error("Station %s has no temperature data, skipping", station_id)
 
-        # Check for missing data
-        if "temperatures" not in data or len(data["temperatures"]) == 0:
-            logger.error(f"Station {station_id} has no temperature data, skipping")
-            rejected_stations.append(station_id)
-            continue
+    valid = ~(low_quality | no_data)
+    valid_stations = station_ids[valid].tolist()
+    rejected_stations = station_ids[~valid].tolist()
 
-        valid_stations.append(station_id)
-        logger.debug(f"Station {station_id} accepted: {len(data['temperatures'])} readings")
+    # Skip the whole loop unless DEBUG records would actually be emitted
+    if verbose and logger.isEnabledFor(logging.DEBUG):
+        for station_id, count in zip(station_ids[valid], n_readings[valid]):
+            logger.debug("Station %s accepted: %d readings", station_id, count)
 
     logger.info(f"Processing complete: {len(valid_stations)} valid, " f"{len(rejected_stations)} rejected")
 
@@ -567,6 +610,41 @@ test_data = {
 result = process_climate_data(test_data, quality_threshold=0.8)
 print(f"\nAcceptance rate: {result['acceptance_rate']:.1%}")
 
+# %% [markdown]
+# The reading counts from `_to_soa` also give every station's mean temperature in one call:
+# concatenate all readings into one flat array, and `np.add.reduceat` sums each slice that starts
+# at a station's offset.
+
+
+# %%
+def station_means(station_data):
+    """
+    Mean temperature of every station that has readings.
+
+    Parameters
+    ----------
+    station_data : dict
+        Data from climate stations
+
+    Returns
+    -------
+    dict
+        Mean temperature keyed by station ID
+    """
+    station_ids, _, n_readings = _to_soa(station_data)
+    # All readings concatenated into one flat array, built only here where it is needed
+    readings = [data.get("temperatures") for data in station_data.values()]
+    all_temps = np.concatenate([np.empty(0)] + [np.asarray(r, dtype=np.float64) for r in readings if r is not None])
+    # Empty stations are left out, since their slice would otherwise pick up
+    # the next station's first reading
+    has_data = n_readings > 0
+    offsets = np.cumsum(n_readings) - n_readings
+    station_sums = np.add.reduceat(all_temps, offsets[has_data])
+    return dict(zip(station_ids[has_data].tolist(), (station_sums / n_readings[has_data]).tolist()))
+
+
+print(f"Station means: {station_means(test_data)}")
+
 # %% [markdown]
 # ### Best Practices for Logging in Research
 #
@@ -588,6 +666,9 @@ print(f"\nAcceptance rate: {result['acceptance_rate']:.1%}")
 # logger.addHandler(file_handler)
 # ```
 #
+# In a package you ship to others, don't configure handlers at import time—add only
+# `logging.getLogger(__name__).addHandler(logging.NullHandler())` and let the application decide.
+#
 # **4. Don't log sensitive data**
 # ```python
 # # BAD
@@ -610,6 +691,20 @@ print(f"\nAcceptance rate: {result['acceptance_rate']:.1%}")
 # - Too little logging: can't diagnose problems
 # - Too much logging: drowning in noise, slow performance
 # - Find the sweet spot for your use case
+#
+# **7. Let logging do the formatting inside loops**
+# ```python
+# # BAD: the f-string is built even when DEBUG is switched off
+# logger.debug(f"Processing station {station_id}")
+#
+# # GOOD: the message is only formatted if the record is emitted
+# logger.debug("Processing station %s", station_id)
+#
+# # For very hot loops, check the level once outside the loop
+# if logger.isEnabledFor(logging.DEBUG):
+#     for station_id in stations:
+#         logger.debug("Processing station %s", station_id)
+# ```
 
 # %% [markdown]
 # <div style="background-color: #f3e5f5; border-left: 5px solid #9c27b0; padding: 15px; margin: 10px 0; border-radius: 5px;">
@@ -724,7 +819,37 @@ print(f"\nAcceptance rate: {result['acceptance_rate']:.1%}")
 # %%
 import cProfile
 import pstats
-from io import StringIO
+
+
+def profile_call(func, *args, top=10, sort="cumulative", builtins=True):
+    """
+    Run a function under cProfile and print the most expensive calls.
+
+    Parameters
+    ----------
+    func : callable
+        Function to profile
+    *args
+        Positional arguments passed to func
+    top : int
+        Number of entries to print
+    sort : str
+        pstats sort key, e.g. "cumulative" or "tottime"
+    builtins : bool
+        Also time built-in functions such as sorted() and sum().
+        Switching this off lowers the profiler overhead.
+
+    Returns
+    -------
+    tuple
+        Return value of func and the pstats.Stats object, which can be
+        re-sorted or queried with print_callers() without profiling again
+    """
+    with cProfile.Profile(builtins=builtins) as profiler:
+        out = func(*args)
+    stats = pstats.Stats(profiler).strip_dirs().sort_stats(sort)
+    stats.print_stats(top)
+    return out, stats
 
 
 def slow_temperature_analysis(temperatures):
@@ -747,6 +872,8 @@ def slow_temperature_analysis(temperatures):
         anomalies.append(anomaly)
 
     # Find extreme values (inefficient - recalculating)
+    # The profile shows calculate_mean called twice: each call is a full sum() over
+    # the same data. Computing mean_temp once and reusing it removes the second pass.
     results["mean"] = calculate_mean(temperatures)
     results["max"] = max(temperatures)
     results["min"] = min(temperatures)
@@ -771,19 +898,8 @@ import random
 random.seed(42)
 large_dataset = [20 + random.gauss(0, 5) for _ in range(10000)]
 
-# Profile the function
-profiler = cProfile.Profile()
-profiler.enable()
-
-result = slow_temperature_analysis(large_dataset)
-
-profiler.disable()
-
-# Print profiling results
-s = StringIO()
-ps = pstats.Stats(profiler, stream=s).sort_stats("cumulative")
-ps.print_stats(10)
-print(s.getvalue())
+# Profile the function and print the top 10 entries
+result, stats = profile_call(slow_temperature_analysis, large_dataset)
 
 # %% [markdown]
 # ### Understanding cProfile Output
@@ -806,11 +922,39 @@ print(s.getvalue())
 # - The `sorted()` calls are expensive
 # - We're recalculating things multiple times
 # - List comprehensions are faster than loops with append
+# - The `anomalies` list is built and never used—dead work shows up in the profile too
+# - The data is read over and over: mean, anomalies, max, min, sort and count are separate passes
+
+# %% [markdown]
+# ### Sampling Profilers: Lower Overhead, Live Processes
+#
+# cProfile records *every* function call. That makes it precise about call counts, but it can slow
+# the program down noticeably and makes code with many small function calls look slower than it is.
+# A *sampling* profiler instead looks at the running program a few hundred times per second, adding
+# only a few percent of overhead:
+#
+# ```bash
+# pip install py-spy scalene
+#
+# # Flame graph of a whole run
+# py-spy record -o profile.svg -- python my_script.py
+#
+# # Live view of a job that is already running (e.g. 30 minutes into a long analysis)
+# py-spy top --pid 12345
+#
+# # Line-by-line CPU and memory, separating Python time from time spent in NumPy/C code
+# scalene --html --outfile profile.html my_script.py
+# ```
+#
+# **Rule of thumb:** use a sampling profiler to find *where* the time goes, and cProfile when you need
+# exact call counts.
 
 # %% [markdown]
 # ### Optimized Version
 #
-# Based on profiling, here's an optimized version:
+# Based on profiling, here's an optimized version. Besides better algorithms, the biggest wins
+# often come from simply *reading the data fewer times*: remove unused work and compute several
+# results in the same pass.
 
 
 # %%
@@ -819,32 +963,38 @@ def fast_temperature_analysis(temperatures):
     Analyze temperature data (optimized version).
 
     Improvements based on profiling:
-    - Calculate mean once, reuse it
-    - Sort once for all percentiles
-    - Use NumPy if available (would be much faster)
+    - Drop work nobody uses: the anomalies list is gone
+    - Fewer passes over the data: min, max and percentiles all come
+      from one partition, the mean is calculated once and reused
+    - No full sort: np.partition only moves the five needed order
+      statistics into place, in O(n) instead of O(n log n)
+    - Readings stored as float32: half the memory traffic of float64,
+      while the mean is still accumulated in float64
     """
-    if not temperatures:
+    if len(temperatures) == 0:
         return {}
 
-    # Sort once, use for multiple purposes
-    sorted_temps = sorted(temperatures)
-    n = len(sorted_temps)
+    temps = np.asarray(temperatures, dtype=np.float32)
+    n = temps.size
+
+    # Partial sort: min, percentiles and max end up at their sorted positions
+    positions = [0, n // 4, n // 2, 3 * n // 4, n - 1]
+    partitioned = np.partition(temps, positions)
 
     # Calculate mean once
-    mean_temp = sum(temperatures) / n
+    mean_temp = float(temps.mean(dtype=np.float64))
 
-    # All calculations in one pass where possible
     results = {
         "mean": mean_temp,
-        "max": sorted_temps[-1],  # Last element of sorted list
-        "min": sorted_temps[0],  # First element of sorted list
-        "p25": sorted_temps[n // 4],
-        "p50": sorted_temps[n // 2],
-        "p75": sorted_temps[3 * n // 4],
+        "max": float(partitioned[n - 1]),
+        "min": float(partitioned[0]),
+        "p25": float(partitioned[n // 4]),
+        "p50": float(partitioned[n // 2]),
+        "p75": float(partitioned[3 * n // 4]),
     }
 
-    # Count above mean (more efficient)
-    results["days_above_mean"] = sum(1 for t in temperatures if t > mean_temp)
+    # Count above mean: one vectorized comparison instead of a Python generator
+    results["days_above_mean"] = int(np.count_nonzero(temps > mean_temp))
 
     return results
 
@@ -866,8 +1016,72 @@ print(f"Slow version: {time_slow:.4f} seconds")
 print(f"Fast version: {time_fast:.4f} seconds")
 print(f"Speedup: {time_slow/time_fast:.2f}x faster")
 
-# Verify results are the same
-print(f"\nResults match: {result_slow == result_fast}")
+# Verify results are the same (up to rounding: float32 storage, NumPy's summation order)
+results_match = all(np.isclose(result_slow[key], result_fast[key]) for key in result_slow)
+print(f"\nResults match: {results_match}")
+
+# %% [markdown]
+# ### Beyond NumPy: Compiling a Loop with Numba
+#
+# Some algorithms are naturally written as loops, for example the running window sum and the
+# regression in `analyze_temperature_trends`. [Numba](https://numba.pydata.org/) compiles such a
+# function to machine code on its first call, so the loop runs at C speed without any Python overhead
+# per iteration. Numba is optional here—if it isn't installed, the cell below just says so.
+#
+# Keep the plain Python version around: you can't step into compiled code with pdb, so debug first,
+# then compile.
+
+
+# %%
+try:
+    from numba import njit
+except ImportError:  # Numba is optional for this lecture
+    njit = None
+
+
+def trend_from_loops(temps, window_size):
+    """
+    Moving-average trend as explicit loops, for compilation with Numba.
+
+    Same result as ``analyze_temperature_trends(temps, window_size)["trend"]``
+    for at least ``window_size + 1`` readings.
+    """
+    n = temps.size - window_size + 1
+    x_mean = (n - 1) / 2.0
+
+    window_sum = 0.0
+    for i in range(window_size):
+        window_sum += temps[i]
+
+    # sum((x - x_mean) * (y - y_mean)) equals sum((x - x_mean) * y), because sum(x - x_mean) is 0
+    numerator = 0.0
+    for i in range(n):
+        if i > 0:
+            window_sum += temps[i + window_size - 1] - temps[i - 1]
+        numerator += (i - x_mean) * (window_sum / window_size)
+
+    return numerator / (n * (n**2 - 1) / 12.0)
+
+
+long_series = np.asarray(large_dataset)
+
+if njit is None:
+    print("Numba is not installed (pip install numba) - skipping the compiled version.")
+else:
+    trend_compiled = njit(cache=True)(trend_from_loops)
+    trend_compiled(long_series, 7)  # First call compiles (cache=True stores the result on disk)
+
+    start = time.time()
+    trend_numpy = analyze_temperature_trends(long_series, window_size=7)["trend"]
+    time_numpy = time.time() - start
+
+    start = time.time()
+    trend_numba = trend_compiled(long_series, 7)
+    time_numba = time.time() - start
+
+    print(f"NumPy version: {time_numpy:.5f} seconds")
+    print(f"Numba version: {time_numba:.5f} seconds")
+    print(f"Same trend: {np.isclose(trend_numpy, trend_numba)}")
 
 # %% [markdown]
 # ## Part 7: Line-by-Line Profiling
@@ -979,12 +1193,76 @@ print(f"\nResults match: {result_slow == result_fast}")
 # del large_data  # Free memory immediately
 # ```
 #
+# Python frees an object as soon as the last reference to it disappears, so `del` is usually all
+# you need; `gc.collect()` only helps with objects that reference each other in a cycle.
+#
 # **4. Use chunking for large files**
 # ```python
 # # Process file in chunks instead of loading all at once
 # for chunk in pd.read_csv('huge_file.csv', chunksize=10000):
 #     process(chunk)
 # ```
+#
+# ### Summaries Without Holding All the Data
+#
+# Chunking only helps if the analysis can work chunk by chunk. Count, mean, minimum and maximum can:
+# keep a few running numbers and update them with every chunk, so memory stays constant no matter
+# how many years of data stream past.
+
+
+# %%
+def streaming_temperature_summary(chunks):
+    """
+    Calculate count, mean, min and max in one pass over chunks of readings.
+
+    Parameters
+    ----------
+    chunks : iterable of array_like
+        Temperature readings, one chunk at a time (e.g. from a file reader)
+
+    Returns
+    -------
+    dict
+        Summary statistics; only a few running values are kept in memory
+    """
+    count = 0
+    total = 0.0
+    lowest = np.inf
+    highest = -np.inf
+
+    for chunk in chunks:
+        chunk = np.asarray(chunk, dtype=np.float64)
+        if chunk.size == 0:
+            continue
+        count += chunk.size
+        total += chunk.sum()
+        lowest = min(lowest, chunk.min())
+        highest = max(highest, chunk.max())
+
+    return {"count": count, "mean": total / count if count else np.nan, "min": lowest, "max": highest}
+
+
+# Feed the large dataset in chunks of 1000 readings, as a file reader would
+chunks = (large_dataset[i : i + 1000] for i in range(0, len(large_dataset), 1000))
+summary = streaming_temperature_summary(chunks)
+print(
+    f"Streamed {summary['count']} readings: mean {summary['mean']:.2f}°C, range {summary['min']:.1f} to {summary['max']:.1f}°C"
+)
+print(f"Same mean as the in-memory version: {np.isclose(summary['mean'], result_fast['mean'])}")
+
+# %% [markdown]
+# Exact percentiles can't be computed this way—they need all values. For very large data, a
+# *sketch* such as the t-digest gives close approximations in a small, fixed amount of memory,
+# and sketches of separate chunks can be merged (handy for parallel processing):
+#
+# ```python
+# from tdigest import TDigest  # pip install tdigest
+#
+# digest = TDigest()
+# for chunk in pd.read_csv('huge_file.csv', chunksize=1_000_000):
+#     digest.batch_update(chunk['temp'].values)
+# p25, p50, p75 = (digest.percentile(q) for q in (25, 50, 75))
+# ```
 
 # %% [markdown]
 # ## Part 9: Practical Profiling Example
@@ -998,13 +1276,46 @@ import time
 
 
 def load_climate_data(n_stations=100, days_per_station=365):
-    """Simulate loading climate data."""
-    data = {}
-    for station in range(n_stations):
-        # Simulate temperature readings
-        temps = [20 + i * 0.01 for i in range(days_per_station)]
-        data[f"station_{station:03d}"] = temps
-    return data
+    """
+    Simulate loading climate data.
+
+    Returns
+    -------
+    dict
+        ``names``: station names; ``temps``: readings as one float32 array of
+        shape (n_stations, days_per_station), one row per station
+    """
+    names = np.array([f"station_{station:03d}" for station in range(n_stations)])
+
+    # Fill a preallocated array chunk by chunk: collecting the chunks in a list and
+    # concatenating them would briefly hold every reading twice
+    temps = np.empty((n_stations, days_per_station), dtype=np.float32)
+    first_day = 0
+    for chunk in iter_climate_days(n_stations, days_per_station):
+        temps[:, first_day : first_day + chunk.shape[1]] = chunk
+        first_day += chunk.shape[1]
+
+    return {"names": names, "temps": temps}
+
+
+def iter_climate_days(n_stations=100, days_per_station=365, chunk_days=64):
+    """
+    Simulate reading climate data a few days at a time.
+
+    Yields
+    ------
+    numpy.ndarray
+        float32 readings of all stations for up to chunk_days days,
+        shape (n_stations, days_in_chunk)
+    """
+    for first_day in range(0, days_per_station, chunk_days):
+        days = np.arange(first_day, min(first_day + chunk_days, days_per_station), dtype=np.float32)
+        # Simulate temperature readings: the same series for every station
+        yield np.broadcast_to(20 + 0.01 * days, (n_stations, days.size)).copy()
+
+
+# Station pairs as rows of a structured array: row indices i < j and correlation r
+PAIR_DTYPE = np.dtype([("i", np.int32), ("j", np.int32), ("r", np.float32)])
 
 
 def naive_correlation_analysis(data):
@@ -1012,18 +1323,22 @@ def naive_correlation_analysis(data):
     Calculate correlations between all station pairs (naive approach).
 
     This is O(n²) in number of stations - very slow for many stations!
+    Returns a structured array of pairs (see PAIR_DTYPE).
     """
-    stations = list(data.keys())
-    n = len(stations)
+    temps = data["temps"]
+    n = len(temps)
 
-    correlations = []
+    # Preallocate for the largest possible number of pairs instead of growing a list
+    correlations = np.empty(n * (n - 1) // 2, dtype=PAIR_DTYPE)
+    n_found = 0
     for i in range(n):
         for j in range(i + 1, n):
             # Simple correlation: do temperatures trend together?
-            temps_i = data[stations[i]]
-            temps_j = data[stations[j]]
+            temps_i = temps[i]
+            temps_j = temps[j]
 
-            # Very naive correlation calculation
+            # Very naive correlation calculation (Python loops over NumPy elements
+            # are even slower than over lists: every element becomes a new object)
             mean_i = sum(temps_i) / len(temps_i)
             mean_j = sum(temps_j) / len(temps_j)
 
@@ -1034,9 +1349,10 @@ def naive_correlation_analysis(data):
 
             if var_i > 0 and var_j > 0:
                 corr = cov / (var_i * var_j) ** 0.5
-                correlations.append((stations[i], stations[j], corr))
+                correlations[n_found] = (i, j, corr)
+                n_found += 1
 
-    return correlations
+    return correlations[:n_found]
 
 
 # Test with smaller dataset
@@ -1048,7 +1364,8 @@ result = naive_correlation_analysis(test_data)
 elapsed = time.time() - start
 
 print(f"Analyzed {len(result)} station pairs in {elapsed:.3f} seconds")
-print(f"First correlation: {result[0]}")
+first = result[0]
+print(f"First correlation: {test_data['names'][first['i']]} - {test_data['names'][first['j']]}: {first['r']:.3f}")
 
 # %% [markdown]
 # ### Profiling Reveals the Problem
@@ -1067,63 +1384,471 @@ print(f"First correlation: {result[0]}")
 # 2. Use NumPy for vectorized operations
 # 3. Only calculate correlations for nearby stations
 # 4. Parallelize if still too slow
+
+# %% [markdown]
+# ### Aside: Summing in Pure Python
 #
+# The idea behind step 2—keep the inner loop out of Python bytecode—applies even to a plain
+# sum. If you stay in pure Python, hand the list straight to the builtin `sum(values)`, which
+# loops in C and is the fast baseline. An explicit loop or `sum()` over a generator runs the loop
+# in bytecode and is several times slower. `math.fsum` sits in between: a few times slower than
+# `sum(values)`, but it tracks the rounding error of every addition and returns the correctly
+# rounded result, so it is the one to use when accuracy matters.
+
+
+# %%
+import math
+import timeit
+
+# Values with a large offset: rounding errors of a plain sum become visible
+values = [1e8 + 0.1] * 100_000 + [-1e8] * 100_000
+
+
+def loop_sum(numbers):
+    """Sum with an explicit local accumulator."""
+    total = 0.0
+    for x in numbers:
+        total += x
+    return total
+
+
+for label, func in [
+    ("sum(values)", lambda: sum(values)),
+    ("sum(generator)", lambda: sum(x for x in values)),
+    ("math.fsum", lambda: math.fsum(values)),
+    ("loop accumulator", lambda: loop_sum(values)),
+]:
+    seconds = timeit.timeit(func, number=10) / 10
+    print(f"{label:17s} {func():.6f} in {seconds * 1000:.1f} ms")
+print("Exact result:     9999.999404 (1e8 + 0.1 itself is already rounded when stored)")
+
+# %% [markdown]
 # ### Optimized Version
 #
 # Here's a smarter approach:
 
 
 # %%
-def smart_correlation_analysis(data):
+def find_nearby_pairs(coords, radius):
+    """
+    Find all station pairs closer than radius using a grid of cells.
+
+    Stations are binned into square cells of side ``radius``, so every
+    neighbor lies in the same or one of the 8 surrounding cells—there is
+    no need to measure the distance between all pairs.
+
+    Parameters
+    ----------
+    coords : list
+        Station positions as (x, y) pairs in km
+    radius : float
+        Maximum distance between paired stations in km
+
+    Returns
+    -------
+    list of tuple
+        Index pairs (i, j) with i < j, sorted
+    """
+    cells = {}
+    for index, (x, y) in enumerate(coords):
+        cells.setdefault((int(x // radius), int(y // radius)), []).append(index)
+
+    pairs = []
+    for (cell_x, cell_y), members in cells.items():
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for j in cells.get((cell_x + dx, cell_y + dy), ()):
+                    for i in members:
+                        if i < j and math.dist(coords[i], coords[j]) <= radius:
+                            pairs.append((i, j))
+    return sorted(pairs)
+
+
+def smart_correlation_analysis(data, coords, radius):
     """
     Calculate correlations more efficiently.
 
     Optimizations:
     - Pre-calculate statistics for each station
-    - Only compare geographically nearby stations (simulated)
-    - Use more efficient calculations
+    - Only compare geographically nearby stations, found with a grid
+      instead of checking the distance of every pair
+    - Use NumPy arrays instead of Python loops over days
     """
-    stations = list(data.keys())
-
-    # Pre-calculate statistics once per station
-    stats = {}
-    for station in stations:
-        temps = data[station]
-        n = len(temps)
-        mean_temp = sum(temps) / n
-        variance = sum((t - mean_temp) ** 2 for t in temps)
-        stats[station] = {"temps": temps, "mean": mean_temp, "variance": variance, "n": n}
-
-    # Only calculate correlations for "nearby" stations
-    # (in real code, this would use actual geographic distance)
-    correlations = []
-    for i, station_i in enumerate(stations):
-        # Only check next 10 stations (simulating geographic proximity)
-        for j in range(i + 1, min(i + 11, len(stations))):
-            station_j = stations[j]
-
-            si = stats[station_i]
-            sj = stats[station_j]
-
-            # Calculate covariance using pre-computed statistics
-            cov = sum((si["temps"][k] - si["mean"]) * (sj["temps"][k] - sj["mean"]) for k in range(si["n"]))
-
-            if si["variance"] > 0 and sj["variance"] > 0:
-                corr = cov / (si["variance"] * sj["variance"]) ** 0.5
-                correlations.append((station_i, station_j, corr))
+    # Pre-calculate statistics for all stations at once: the centered series and 1 / norm are
+    # reused for every pair. The subtraction also converts to float64, so no separate copy is made.
+    temps = data["temps"]
+    centered = temps - temps.mean(axis=1, dtype=np.float64, keepdims=True)
+    variances = np.einsum("ij,ij->i", centered, centered)
+    inv_norms = np.zeros_like(variances)
+    np.divide(1.0, np.sqrt(variances), out=inv_norms, where=variances > 0)
+
+    # Only calculate correlations for stations within radius of each other
+    pairs = np.array(find_nearby_pairs(coords, radius), dtype=np.int32).reshape(-1, 2)
+    pairs = pairs[(variances[pairs[:, 0]] > 0) & (variances[pairs[:, 1]] > 0)]
+    correlations = np.empty(len(pairs), dtype=PAIR_DTYPE)
+    correlations["i"], correlations["j"] = pairs[:, 0], pairs[:, 1]
+
+    # Pairs are sorted by i: one matrix-vector product gives station i's covariances with all its neighbors
+    starts = np.flatnonzero(np.diff(pairs[:, 0], prepend=-1))
+    ends = np.append(starts[1:], len(pairs))
+    for start, end in zip(starts, ends):
+        i, neighbors = pairs[start, 0], pairs[start:end, 1]
+        covariances = centered[neighbors] @ centered[i]
+        correlations["r"][start:end] = covariances * inv_norms[neighbors] * inv_norms[i]
 
     return correlations
 
 
+# Simulated station positions in a 1000 km x 1000 km region, in the same order as the stations
+rng = np.random.default_rng(42)
+station_coords = rng.uniform(0, 1000, size=(len(test_data["names"]), 2)).tolist()
+
 # Compare performance
 start = time.time()
-result_smart = smart_correlation_analysis(test_data)
+result_smart = smart_correlation_analysis(test_data, station_coords, radius=250)
 elapsed_smart = time.time() - start
 
 print(f"\nSmart version analyzed {len(result_smart)} pairs in {elapsed_smart:.3f} seconds")
 print(f"Speedup: {elapsed/elapsed_smart:.2f}x faster")
 print(f"(Analyzed fewer pairs by focusing on nearby stations)")
 
+# %% [markdown]
+# ### Vectorized Version
+#
+# Profiling showed that the time goes into Python-level loops over pairs and days. Stacking all
+# stations into one 2-D array turns every pairwise covariance into a single matrix product, which
+# NumPy hands to highly optimized linear algebra code—so we can afford to compare *all* pairs again:
+
+
+# %%
+try:
+    import cupy as cp
+except ImportError:  # CuPy (and a GPU) is optional for this lecture
+    cp = None
+
+
+def vectorized_correlation_analysis(data, min_abs_corr=None, use_gpu=False):
+    """
+    Calculate correlations between all station pairs with one matrix product.
+
+    Same result as naive_correlation_analysis (up to float32 rounding): the covariances of all pairs
+    come from ``centered @ centered.T`` instead of nested Python loops. With ``min_abs_corr``,
+    only pairs with ``|r| > min_abs_corr`` are returned. With ``use_gpu``, the calculation runs
+    on the GPU through CuPy, which offers the same functions as NumPy.
+    """
+    if use_gpu and cp is None:
+        raise ImportError("use_gpu=True requires CuPy (pip install cupy-cuda12x)")
+    xp = cp if use_gpu else np
+    temps = xp.asarray(data["temps"])
+
+    # Subtract each station's mean once, staying in float32: the matrix product then
+    # moves half the bytes of float64. Norms and the final division use float64.
+    centered = temps - temps.mean(axis=1, dtype=xp.float64, keepdims=True).astype(temps.dtype)
+    norms = xp.sqrt(xp.einsum("ij,ij->i", centered, centered, dtype=xp.float64))
+    covariances = centered @ centered.T
+
+    # Upper triangle without the diagonal: every pair (i, j) with i < j exactly once
+    i, j = xp.triu_indices(len(temps), k=1)
+    keep = (norms[i] > 0) & (norms[j] > 0)
+    i, j = i[keep], j[keep]
+    corrs = xp.clip(covariances[i, j] / (norms[i] * norms[j]), -1.0, 1.0)  # Rounding could leave |r| > 1
+
+    # Drop weak pairs with one mask over all pairs, before building the output
+    if min_abs_corr is not None:
+        strong = xp.abs(corrs) > min_abs_corr
+        i, j, corrs = i[strong], j[strong], corrs[strong]
+
+    if use_gpu:
+        # Only the surviving pairs are copied back from GPU memory
+        i, j, corrs = cp.asnumpy(i), cp.asnumpy(j), cp.asnumpy(corrs)
+
+    correlations = np.empty(len(i), dtype=PAIR_DTYPE)
+    correlations["i"], correlations["j"], correlations["r"] = i, j, corrs
+    return correlations
+
+
+start = time.time()
+result_vectorized = vectorized_correlation_analysis(test_data)
+elapsed_vectorized = time.time() - start
+
+print(f"Vectorized version analyzed {len(result_vectorized)} pairs in {elapsed_vectorized:.3f} seconds")
+print(f"Speedup over naive version: {elapsed/elapsed_vectorized:.0f}x faster")
+same_pairs = np.array_equal(result[["i", "j"]], result_vectorized[["i", "j"]])
+same_values = np.allclose(result["r"], result_vectorized["r"])
+print(f"Same correlations as naive version: {same_pairs and same_values}")
+
+# The simulated stations all share one series, so every |r| is 1 and a threshold drops nothing.
+# To see the filter at work, give half the stations a seasonal cycle plus noise and the rest noise only.
+n_mixed, n_days = test_data["temps"].shape
+seasonal = 10 * np.sin(2 * np.pi * np.arange(n_days) / 365)
+has_cycle = np.arange(n_mixed)[:, None] < n_mixed // 2
+mixed_temps = (rng.normal(0, 1, size=(n_mixed, n_days)) + np.where(has_cycle, seasonal, 0)).astype(np.float32)
+mixed_data = {"names": test_data["names"], "temps": mixed_temps}
+n_strong = len(vectorized_correlation_analysis(mixed_data, min_abs_corr=0.9))
+print(f"Pairs with |r| > 0.9: {n_strong} of {len(vectorized_correlation_analysis(mixed_data))}")
+
+# A GPU pays off for many stations; for 50 stations, copying the data costs more than it saves
+if cp is None:
+    print("CuPy is not installed - skipping the GPU version.")
+else:
+    result_gpu = vectorized_correlation_analysis(test_data, use_gpu=True)
+    print(f"GPU version gives the same correlations: {np.allclose(result_gpu['r'], result_vectorized['r'])}")
+
+# %% [markdown]
+# If you'd rather keep the explicit loops (for example because the real calculation doesn't map onto a
+# matrix product), Numba from Part 6 can compile them instead. With `parallel=True`, the outer loop
+# written as `prange` is spread across all CPU cores.
+
+
+# %%
+if njit is None:
+    prange = range  # Plain Python loops still work without Numba, just slowly
+else:
+    from numba import guvectorize, prange
+
+
+def correlation_matrix_loops(temps):
+    """
+    Correlation matrix of all station pairs as explicit loops, for compilation with Numba.
+
+    Rows of ``temps`` are stations, columns are days. Only the upper triangle
+    (i < j) is filled; pairs involving a constant series stay 0.
+    """
+    n_stations, n_days = temps.shape
+
+    # Per-station pass: centered series and 1 / norm
+    centered = np.empty((n_stations, n_days))
+    inv_norms = np.zeros(n_stations)
+    for i in range(n_stations):
+        mean = 0.0
+        for k in range(n_days):
+            mean += temps[i, k]
+        mean /= n_days
+        sum_squares = 0.0
+        for k in range(n_days):
+            centered[i, k] = temps[i, k] - mean
+            sum_squares += centered[i, k] ** 2
+        if sum_squares > 0:
+            inv_norms[i] = 1.0 / np.sqrt(sum_squares)
+
+    # Pair pass: rows i are independent, so they can run in parallel
+    corr = np.zeros((n_stations, n_stations))
+    for i in prange(n_stations):
+        for j in range(i + 1, n_stations):
+            cov = 0.0
+            for k in range(n_days):
+                cov += centered[i, k] * centered[j, k]
+            corr[i, j] = cov * inv_norms[i] * inv_norms[j]
+    return corr
+
+
+if njit is None:
+    print("Numba is not installed (pip install numba) - skipping the compiled version.")
+else:
+    # fastmath lets the compiler reorder the sums so they use SIMD instructions
+    correlation_compiled = njit(parallel=True, fastmath=True, cache=True)(correlation_matrix_loops)
+    temps_matrix = test_data["temps"]
+    correlation_compiled(temps_matrix)  # First call compiles
+
+    start = time.time()
+    corr_matrix = correlation_compiled(temps_matrix)
+    elapsed_numba = time.time() - start
+
+    rows, cols = np.triu_indices(len(temps_matrix), k=1)
+    print(f"Numba version: {elapsed_numba:.4f} seconds (vectorized: {elapsed_vectorized:.4f} seconds)")
+    print(f"Same correlations: {np.allclose(corr_matrix[rows, cols], result_vectorized['r'])}")
+
+    # A generalized ufunc: write the calculation for ONE pair of series, and NumPy-style
+    # broadcasting applies it to all pairs, spread over the CPU cores
+    @guvectorize(["void(float32[:], float32[:], float64[:])"], "(d),(d)->()", target="parallel")
+    def pair_correlation(x, y, out):
+        n_days = x.shape[0]
+        mean_x = 0.0
+        mean_y = 0.0
+        for k in range(n_days):
+            mean_x += x[k]
+            mean_y += y[k]
+        mean_x /= n_days
+        mean_y /= n_days
+        cov = var_x = var_y = 0.0
+        for k in range(n_days):
+            dx = x[k] - mean_x
+            dy = y[k] - mean_y
+            cov += dx * dy
+            var_x += dx * dx
+            var_y += dy * dy
+        out[0] = cov / np.sqrt(var_x * var_y) if var_x > 0 and var_y > 0 else 0.0
+
+    pair_corrs = pair_correlation(temps_matrix[rows], temps_matrix[cols])
+    print(f"Generalized ufunc gives the same correlations: {np.allclose(pair_corrs, result_vectorized['r'])}")
+
+# %% [markdown]
+# The last step down would be writing the kernel in C yourself and calling it with `ctypes`. This is
+# rarely worth it for research code—Numba usually reaches the same speed without leaving Python—but
+# it shows what "compiled" means:
+#
+# ```c
+# /* corr_kernel.c - build with: gcc -O3 -march=native -shared -fPIC corr_kernel.c -o libcorr.so */
+# void corr_pairs(const float *centered, const float *inv_norms, int n, int days, float *out)
+# {
+#     for (int i = 0; i < n; i++)
+#         for (int j = i + 1; j < n; j++) {
+#             float cov = 0.0f;
+#             for (int k = 0; k < days; k++)  /* the compiler turns this into SIMD instructions */
+#                 cov += centered[i * days + k] * centered[j * days + k];
+#             out[i * n + j] = cov * inv_norms[i] * inv_norms[j];
+#         }
+# }
+# ```
+#
+# ```python
+# import ctypes
+#
+# lib = ctypes.CDLL("./libcorr.so")
+# pointer = np.ctypeslib.ndpointer(dtype=np.float32, flags="C_CONTIGUOUS")
+# lib.corr_pairs.argtypes = [pointer, pointer, ctypes.c_int, ctypes.c_int, pointer]
+# out = np.zeros((n, n), dtype=np.float32)
+# lib.corr_pairs(centered, inv_norms, n, days, out)
+# ```
+#
+# Every detail—memory layout, data types, array sizes—is now your responsibility, and a mistake
+# crashes Python instead of raising an exception. Start with NumPy, reach for Numba next.
+
+# %% [markdown]
+# ### Don't Compute the Same Thing Twice
+#
+# In an interactive session you often re-run an analysis on unchanged data—to try another threshold,
+# or to redo a plot. Remembering earlier results (*memoization*) makes such repeats instant. The cache
+# key must describe the data's *content*, not just the variable name, so a hash of the array is used:
+
+
+# %%
+import hashlib
+
+_CORRELATION_CACHE = {}
+
+
+def cached_correlation_analysis(data):
+    """
+    Return vectorized_correlation_analysis(data), reusing the result for identical data.
+
+    Hashing the readings reads each value once, which is far cheaper than
+    comparing all station pairs again.
+    """
+    temps = data["temps"]
+    key = (temps.shape, temps.dtype.str, hashlib.blake2b(temps.tobytes(), digest_size=16).digest(), tuple(data["names"]))
+    if key not in _CORRELATION_CACHE:
+        _CORRELATION_CACHE[key] = vectorized_correlation_analysis(data)
+    return _CORRELATION_CACHE[key].copy()  # A copy, so callers can't change the cached result
+
+
+def clear_correlation_cache():
+    """Forget all cached correlation results, e.g. to free memory."""
+    _CORRELATION_CACHE.clear()
+
+
+for attempt in ("First call", "Second call"):
+    start = time.time()
+    cached_correlation_analysis(test_data)
+    print(f"{attempt}: {time.time() - start:.5f} seconds")
+
+# %% [markdown]
+# ### When the Readings Don't Fit in Memory
+#
+# All versions so far hold every reading at once. Correlations can also be built up from chunks
+# of days, as they are read from disk: keep each station's mean and the sums of products of
+# deviations (*co-moments*) for every pair, and update them with one matrix product per chunk.
+# Memory then depends on the number of stations, not the number of days. Because two such
+# summaries combine with the same formula, results from separate files or processes can be merged.
+
+
+# %%
+class RunningCorrelation:
+    """Correlation matrix of all stations, accumulated chunk by chunk."""
+
+    def __init__(self):
+        """Start with no readings."""
+        self.n_days = 0
+        self.means = None
+        self.comoments = None
+
+    def update(self, chunk):
+        """
+        Add readings of all stations for some days.
+
+        Parameters
+        ----------
+        chunk : array_like
+            Readings with shape (n_stations, days_in_chunk)
+        """
+        chunk = np.asarray(chunk, dtype=np.float64)
+        if chunk.shape[1] == 0:
+            return self
+        block = RunningCorrelation()
+        block.n_days = chunk.shape[1]
+        block.means = chunk.mean(axis=1)
+        centered = chunk - block.means[:, np.newaxis]
+        block.comoments = centered @ centered.T
+        return self.merge(block)
+
+    def merge(self, other):
+        """
+        Combine with the summary of other days for the same stations.
+
+        Works on deviations from the means, so unlike subtracting large raw sums
+        at the end, no significant digits are lost.
+        """
+        if other.n_days == 0:
+            return self
+        if self.n_days == 0:
+            self.n_days, self.means, self.comoments = other.n_days, other.means.copy(), other.comoments.copy()
+            return self
+        n_days = self.n_days + other.n_days
+        delta = other.means - self.means
+        self.comoments = self.comoments + other.comoments + np.outer(delta, delta) * (self.n_days * other.n_days / n_days)
+        self.means = self.means + delta * (other.n_days / n_days)
+        self.n_days = n_days
+        return self
+
+    def result(self):
+        """Return the correlation matrix; entries involving a constant series are 0."""
+        norms = np.sqrt(np.diag(self.comoments))
+        scale = np.outer(norms, norms)
+        corr = np.zeros_like(self.comoments)
+        np.divide(self.comoments, scale, out=corr, where=scale > 0)
+        return corr
+
+
+def streaming_correlation_matrix(chunks):
+    """
+    Correlation matrix of all stations, accumulated over chunks of days.
+
+    Parameters
+    ----------
+    chunks : iterable of numpy.ndarray
+        Readings with shape (n_stations, days_in_chunk), e.g. from iter_climate_days
+
+    Returns
+    -------
+    numpy.ndarray
+        Correlation matrix, shape (n_stations, n_stations)
+    """
+    running = RunningCorrelation()
+    for chunk in chunks:
+        running.update(chunk)
+    return running.result()
+
+
+corr_streamed = streaming_correlation_matrix(iter_climate_days(n_stations=50, days_per_station=365, chunk_days=30))
+rows, cols = np.triu_indices(len(corr_streamed), k=1)
+print(f"Streamed 30 days at a time - same correlations: {np.allclose(corr_streamed[rows, cols], result_vectorized['r'])}")
+
+# Two "files" (first and second half of the year) summarized separately, then merged
+first_half = RunningCorrelation().update(test_data["temps"][:, :180])
+second_half = RunningCorrelation().update(test_data["temps"][:, 180:])
+corr_merged = first_half.merge(second_half).result()
+print(f"Merged two halves - same correlations: {np.allclose(corr_merged[rows, cols], result_vectorized['r'])}")
+
 # %% [markdown]
 # ### Lessons from Profiling
 #
@@ -1133,7 +1858,7 @@ print(f"(Analyzed fewer pairs by focusing on nearby stations)")
 # 2. **Algorithm matters** - O(n²) vs O(n) is huge for large n
 # 3. **Pre-compute when possible** - Don't recalculate the same values
 # 4. **Know your data** - Geographic locality lets us skip comparisons
-# 5. **Use the right tools** - NumPy would make this even faster
+# 5. **Use the right tools** - NumPy turns the pair loops into one fast matrix product
 #
 # **General optimization principles for research code:**
 #
@@ -4,49 +4,130 @@ Simple data analysis script for containerization demo.
 This demonstrates a realistic research workflow that can be containerized.
 """
 
+import io
+import os
 import sys
+from typing import NamedTuple
+
 import numpy as np
 
+# Samples generated per step: small enough to stay in the CPU cache
+CHUNK_SIZE = 65_536
+
+# Created once and reused by every call, instead of setting up a generator each time
+_RNG = np.random.default_rng()
+
+
+class Stats(NamedTuple):
+    """Summary statistics of the generated sample."""
+
+    mean: float
+    std: float
+    min: float
+    max: float
+    count: int
 
-def analyze_data(data_size=100):
+
+def _chunk_moments(chunk):
+    """Return sum, sum of squares, min and max of a chunk using NumPy reductions."""
+    return chunk.sum(dtype=np.float64), np.einsum("i,i->", chunk, chunk, dtype=np.float64), chunk.min(), chunk.max()
+
+
+def analyze_data(data_size=100, rng=None):
     """
     Perform simple data analysis.
 
+    The samples are generated and summarized chunk by chunk, so memory use
+    does not grow with data_size.
+
     Parameters
     ----------
     data_size : int
         Number of data points to generate
+    rng : numpy.random.Generator, optional
+        Random number generator to draw from; pass ``np.random.default_rng(seed)``
+        for reproducible results. Defaults to a generator shared by all calls.
 
     Returns
     -------
-    dict
+    Stats
         Analysis results
     """
-    # Generate sample data
-    data = np.random.randn(data_size)
+    if rng is None:
+        rng = _RNG
+    if data_size == 0:
+        # Nothing to summarize; NaN statistics, like NumPy's reductions on an empty array
+        return Stats(mean=np.nan, std=np.nan, min=np.nan, max=np.nan, count=0)
+
+    # Scratch space for one chunk of samples, allocated once per call and reused for
+    # every chunk; a per-call buffer keeps concurrent callers from overwriting each other
+    buffer = np.empty(min(CHUNK_SIZE, data_size), dtype=np.float32)
 
-    # Perform analysis
-    results = {"mean": np.mean(data), "std": np.std(data), "min": np.min(data), "max": np.max(data), "count": len(data)}
+    total = 0.0
+    sum_squares = 0.0
+    data_min = np.inf
+    data_max = -np.inf
+    for start in range(0, data_size, CHUNK_SIZE):
+        # Generate sample data into the preallocated buffer
+        # (float32 is plenty for 4 printed decimals and halves the bytes)
+        chunk = buffer[: min(CHUNK_SIZE, data_size - start)]
+        rng.standard_normal(dtype=np.float32, out=chunk)
 
-    return results
+        # Update running sums (accumulated in float64) and extremes; no need to keep the samples
+        chunk_sum, chunk_sum_squares, chunk_min, chunk_max = _chunk_moments(chunk)
+        total += chunk_sum
+        sum_squares += chunk_sum_squares
+        data_min = min(data_min, chunk_min)
+        data_max = max(data_max, chunk_max)
+
+    # Derive mean and std from the sum and sum of squares. The sum-of-squares
+    # formula is accurate here because the samples are centered near 0.
+    mean = total / data_size
+    return Stats(
+        mean=float(mean),
+        std=float(np.sqrt(max(sum_squares / data_size - mean**2, 0.0))),
+        min=float(data_min),
+        max=float(data_max),
+        count=data_size,
+    )
+
+
+# Complete report, filled in with str.format_map and written in one go
+REPORT = """\
+==================================================
+Containerized Data Analysis Demo
+==================================================
+
+Analysis Results:
+  Sample size: {count}
+  Mean:        {mean:.4f}
+  Std Dev:     {std:.4f}
+  Min:         {min:.4f}
+  Max:         {max:.4f}
+
+✅ Analysis completed successfully!
+==================================================
+"""
+
+
+def _write_stdout(text):
+    """Write text straight to the standard output file descriptor, skipping Python's text layer."""
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        # Redirected or captured stdout (redirect_stdout, pytest, Jupyter) has no real file descriptor
+        sys.stdout.write(text)
+        return
+    payload = memoryview(text.encode("utf-8"))
+    sys.stdout.flush()  # Keep anything printed earlier in front of the report
+    while payload:  # os.write may write fewer bytes than requested
+        payload = payload[os.write(fd, payload) :]
 
 
 def main():
     """Run the analysis and print results."""
-    print("=" * 50)
-    print("Containerized Data Analysis Demo")
-    print("=" * 50)
-
     results = analyze_data(1000)
-
-    print("\nAnalysis Results:")
-    print(f"  Sample size: {results['count']}")
-    print(f"  Mean:        {results['mean']:.4f}")
-    print(f"  Std Dev:     {results['std']:.4f}")
-    print(f"  Min:         {results['min']:.4f}")
-    print(f"  Max:         {results['max']:.4f}")
-    print("\n✅ Analysis completed successfully!")
-    print("=" * 50)
+    _write_stdout(REPORT.format_map(results._asdict()))
 
     return 0
 
@@ -447,15 +447,11 @@
 #
 # ```dockerfile
 # # Dockerfile for climate data analysis
-# FROM python:3.10-slim
 #
-# # Metadata
-# LABEL maintainer="researcher@university.edu"
-# LABEL description="Climate data analysis pipeline"
-# LABEL org.opencontainers.image.source="https://github.com/user/climate-analysis"
+# # ---- Stage 1: builder - compilers and headers, only needed to build packages ----
+# FROM python:3.10-slim-bookworm AS builder
 #
-# # Install system dependencies needed by scientific packages
-# RUN apt-get update && apt-get install -y \
+# RUN apt-get update && apt-get install -y --no-install-recommends \
 #     gcc \
 #     g++ \
 #     gfortran \
@@ -464,14 +460,32 @@
 #     libproj-dev \
 #     && rm -rf /var/lib/apt/lists/*
 #
+# # Install Python dependencies into a separate prefix we can copy later
+# COPY requirements.txt .
+# RUN pip install --no-cache-dir --prefix=/install -r requirements.txt
+#
+# # ---- Stage 2: runtime - what actually ships ----
+# FROM python:3.10-slim-bookworm AS runtime
+#
+# # Metadata
+# LABEL maintainer="researcher@university.edu"
+# LABEL description="Climate data analysis pipeline"
+# LABEL org.opencontainers.image.source="https://github.com/user/climate-analysis"
+#
+# # Runtime libraries only - no compilers, no -dev headers
+# RUN apt-get update && apt-get install -y --no-install-recommends \
+#     libhdf5-103-1 \
+#     libnetcdf19 \
+#     libproj25 \
+#     && rm -rf /var/lib/apt/lists/*
+#
+# # Installed packages from the builder stage
+# COPY --from=builder /install /usr/local
+#
 # # Create non-root user (security best practice)
 # RUN useradd -m -s /bin/bash researcher
 # WORKDIR /home/researcher/app
 #
-# # Install Python dependencies as root
-# COPY requirements.txt .
-# RUN pip install --no-cache-dir -r requirements.txt
-#
 # # Copy application
 # COPY --chown=researcher:researcher . .
 #
@@ -485,6 +499,12 @@
 # CMD ["python"]
 # ```
 #
+# **Why two stages?** Compilers and header files are only needed while `pip` builds packages.
+# The final image starts again from a clean base and copies in just the installed packages, so
+# everyone who pulls it downloads several hundred megabytes less. The runtime library names
+# (`libhdf5-103-1`, ...) belong to the Debian release, which is why the base image names it
+# (`-bookworm`) instead of floating with `python:3.10-slim`.
+#
 # ### Step 2: Create requirements.txt
 # ```txt
 # numpy==1.24.3
@@ -897,26 +917,52 @@
 # ```dockerfile
 # FROM ubuntu:22.04
 #
-# # Install Python, R, and Julia
-# RUN apt-get update && apt-get install -y \
+# # Install Python, R, and Julia (one layer, apt cache removed in the same step)
+# RUN apt-get update && apt-get install -y --no-install-recommends \
 #     python3 python3-pip \
 #     r-base \
-#     wget
+#     wget ca-certificates \
+#     && wget https://julialang-s3.julialang.org/bin/linux/x64/1.9/julia-1.9.0-linux-x86_64.tar.gz \
+#     && tar xzf julia-1.9.0-linux-x86_64.tar.gz -C /opt \
+#     && ln -s /opt/julia-1.9.0/bin/julia /usr/local/bin/julia \
+#     && rm julia-1.9.0-linux-x86_64.tar.gz \
+#     && rm -rf /var/lib/apt/lists/*
 #
-# # Install Julia
-# RUN wget https://julialang-s3.julialang.org/bin/linux/x64/1.9/julia-1.9.0-linux-x86_64.tar.gz && \
-#     tar xzf julia-1.9.0-linux-x86_64.tar.gz -C /opt && \
-#     ln -s /opt/julia-1.9.0/bin/julia /usr/local/bin/julia
+# WORKDIR /app
 #
-# # Install language-specific packages
-# RUN pip3 install numpy pandas
-# RUN R -e "install.packages('ggplot2')"
-# RUN julia -e 'using Pkg; Pkg.add("DataFrames")'
+# # Package lists first: each install is only re-run when its own list changes
+# COPY requirements.txt .
+# RUN pip3 install --no-cache-dir -r requirements.txt
 #
-# COPY . /app
-# WORKDIR /app
+# COPY install_packages.R .
+# RUN Rscript install_packages.R
+#
+# # Make /app the active Julia environment, for this build step and for every later `julia` call
+# ENV JULIA_PROJECT=/app
+# COPY Project.toml Manifest.toml ./
+# RUN julia -e 'using Pkg; Pkg.instantiate(); Pkg.precompile()'
+#
+# # Code last: editing a script only rebuilds this layer
+# COPY . .
+# ```
+#
+# R has no standard requirements file, so `install_packages.R` plays that role—a short script that
+# installs the R packages from a dated CRAN snapshot, which pins their versions:
+#
+# ```r
+# # install_packages.R
+# options(repos = c(CRAN = "https://packagemanager.posit.co/cran/2023-06-01"))
+# install.packages("ggplot2")
 # ```
 #
+# For Julia, `Project.toml` and `Manifest.toml` already pin every package. `ENV JULIA_PROJECT=/app` makes
+# that environment the default, so a plain `julia analysis.jl` in the container uses the packages that
+# were instantiated during the build instead of an empty global environment.
+#
+# Docker reuses a cached layer as long as nothing it depends on has changed. With the package lists
+# copied and installed *before* the code, changing an analysis script rebuilds in seconds instead of
+# reinstalling every Python, R and Julia package.
+#
 # ### Language-Specific Base Images
 #
 # Use official images for best practices:
@@ -962,6 +1008,25 @@
 # FROM python:3.10-alpine
 # ```
 #
+# **Combine a small base with a multi-stage build** (like the Part 4 example) to ship neither
+# compilers nor headers. On Alpine, the two stages look like this:
+# ```dockerfile
+# FROM python:3.10-alpine AS builder
+# RUN apk add --no-cache gcc g++ gfortran musl-dev hdf5-dev netcdf-dev proj-dev
+# COPY requirements.txt .
+# RUN pip install --no-cache-dir --prefix=/install -r requirements.txt
+#
+# FROM python:3.10-alpine AS runtime
+# RUN apk add --no-cache hdf5 netcdf proj
+# COPY --from=builder /install /usr/local
+# ```
+#
+# The catch: Alpine uses the musl C library instead of glibc, so the usual pre-built wheels don't
+# fit. Only newer releases publish `musllinux` wheels (e.g. NumPy ≥ 1.25, pandas ≥ 2.1); older
+# pins like `numpy==1.24.3` are compiled from source, which makes builds slow and can change
+# numerical behavior. Check with `pip install --only-binary=:all: -r requirements.txt` before
+# switching—if that fails, stay with `-slim`.
+#
 # **Clean up in same layer:**
 # ```dockerfile
 # # Creates 2 layers (unnecessary)